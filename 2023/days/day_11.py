@@ -9,7 +9,7 @@ def _parse(input_data: str) -> tuple[Matrix, list[Coordinate]]:
     - remove galaxy_map
     """
     galaxy_map = Matrix(input_data.splitlines())
-    galaxies = galaxy_map.find_all("#")
+    galaxies = list(galaxy_map.find_all("#"))
 
     return (galaxy_map, galaxies)
 
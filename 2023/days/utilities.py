@@ -17,33 +17,55 @@ def pairwise_without_overlap(iterable):
     return zip(a, a)
 
 
-class Coordinate:
-    """Represent a single point within a 2D space."""
+# Registry of the hot paths counted by python -m aoc run --count-calls, see
+# aoc/counting.py.
+HOT_PATHS = []
+
+
+def hot_path(function):
+    HOT_PATHS.append(function)
+    return function
+
+
+# Creates a coordinate without calling the named tuple __new__, see the
+# coordinate benchmark in aoc/microbench.py.
+_new_tuple = tuple.__new__
 
-    x: int
-    y: int
 
-    def __init__(self, x, y) -> "Coordinate":
-        self.x = x
-        self.y = y
+class Coordinate(typing.NamedTuple):
+    """Represent a single point within a 2D space.
 
-    def __hash__(self) -> int:
-        return hash((self.x, self.y))
+    Backed by a tuple, so it is immutable without a per instance __dict__, hashed
+    and compared in C (as the tuple (x, y), which it equals) and sorted by x, then y.
+    Adding a tuple to a coordinate, in either order, adds the coordinates rather
+    than concatenating them.
+    """
+
+    # pylint does not see that a named tuple is subscriptable
+    # pylint: disable=unsubscriptable-object
+
+    x: int
+    y: int
 
     def __repr__(self) -> str:
         return f"<Coordinate x: {self.x}, y:{self.y}>"
 
+    @hot_path
     def __add__(self, other: "Coordinate") -> "Coordinate":
-        return Coordinate(self.x + other.x, self.y + other.y)
+        return _new_tuple(Coordinate, (self[0] + other[0], self[1] + other[1]))
+
+    __radd__ = __add__
 
+    @hot_path
     def __sub__(self, other: "Coordinate") -> "Coordinate":
-        return Coordinate(self.x - other.x, self.y - other.y)
+        return _new_tuple(Coordinate, (self[0] - other[0], self[1] - other[1]))
 
-    def __eq__(self, other: "Coordinate") -> bool:
-        return self.x == other.x and self.y == other.y
+    def __mul__(self, other: int) -> "Coordinate":
+        if isinstance(other, int):
+            return _new_tuple(Coordinate, (self[0] * other, self[1] * other))
+        raise TypeError
 
-    def __lt__(self, other: "Coordinate") -> bool:
-        return (self.x, self.y) < (other.x, other.y)
+    __rmul__ = __mul__
 
     def neighbours(self) -> typing.Generator["Coordinate", None, None]:
         deltas = [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
@@ -81,6 +103,7 @@ class Matrix:
         index = coordinate.x * self.columns + coordinate.y
         self._data[index] = value
 
+    @hot_path
     def get(self, coordinate: Coordinate):
         index = coordinate.x * self.columns + coordinate.y
         return self._data[index]
@@ -0,0 +1,61 @@
+"""Day 4: Ceres Search, on a NumPy array
+
+Rather than walking from every X (or A), the masks of the letters are shifted
+so every cell sees the letter n steps away in a direction, and a word is found
+where all shifted masks are set.
+"""
+
+import numpy as np
+
+from .utilities import ArrayGrid
+
+DIRECTIONS = [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+
+def _parse(input_data: str):
+    return ArrayGrid(input_data.splitlines())
+
+
+def _part1(grid: ArrayGrid) -> int:
+    masks = [grid.mask(letter) for letter in "XMAS"]
+
+    result = 0
+    for dx, dy in DIRECTIONS:
+        found = masks[0].copy()
+        for n in range(1, 4):
+            found &= ArrayGrid.shifted(masks[n], n * dx, n * dy)
+        result += int(np.count_nonzero(found))
+
+    return result
+
+
+def _part2(grid: ArrayGrid) -> int:
+    m = grid.mask("M")
+    s = grid.mask("S")
+
+    def diagonal(dx, dy):
+        """MAS or SAM through every cell along the diagonal (dx, dy)."""
+        ahead_m = ArrayGrid.shifted(m, dx, dy)
+        ahead_s = ArrayGrid.shifted(s, dx, dy)
+        behind_m = ArrayGrid.shifted(m, -dx, -dy)
+        behind_s = ArrayGrid.shifted(s, -dx, -dy)
+        return (ahead_m & behind_s) | (ahead_s & behind_m)
+
+    return int(np.count_nonzero(grid.mask("A") & diagonal(1, 1) & diagonal(1, -1)))
+
+
+def solve(input_data: str) -> tuple[int, int]:
+    parsed_input = _parse(input_data)
+    return (_part1(parsed_input), _part2(parsed_input))
+
+
+if __name__ == "__main__":
+    from aocd.models import Puzzle
+
+    puzzle = Puzzle(year=2024, day=4)
+    example = puzzle.examples[0]
+    example_input = example.input_data
+
+    solution = solve(example_input)
+    print(f"Part 1: {solution[0]}, expecting: {example.answer_a}")
+    print(f"Part 2: {solution[1]}, expecting: {example.answer_b}")
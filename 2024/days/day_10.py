@@ -1,19 +1,24 @@
 """Day 10: Hoof It"""
 
-from .utilities import Grid, Coordinate
+from .utilities import FlatGrid
+
+# Heights are compared as byte values of the cells
+SUMMIT = ord("9")
 
 
 def _parse(input_data: str):
-    return Grid(input_data.splitlines())
+    return FlatGrid(input_data.splitlines())
 
 
 def _part1(parsed_input) -> int:
     grid = parsed_input
+    cells = grid.cells
+    neighbours = grid.neighbours4
 
     result = 0
-    for start in grid.find_all("0"):
+    for start in grid.find_indices("0"):
         todo = [start]
-        seen: set[Coordinate] = set()
+        seen: set[int] = set()
         endpoints = set()
 
         while todo:
@@ -22,18 +27,17 @@ def _part1(parsed_input) -> int:
                 continue
             seen.add(current_pos)
 
-            height = grid.get(current_pos)
-            if height == "9":
+            height = cells[current_pos]
+            if height == SUMMIT:
                 endpoints.add(current_pos)
                 continue
 
-            options = [
+            expected_height = height + 1
+            todo += [
                 x
-                for x in grid.neighbours(current_pos, include_diagonals=False)
-                if x not in seen
+                for x in neighbours[current_pos]
+                if x not in seen and cells[x] == expected_height
             ]
-            expected_height = str(int(height) + 1)
-            todo += [x for x in options if grid.get(x) == expected_height]
 
         result += len(endpoints)
 
@@ -42,29 +46,27 @@ def _part1(parsed_input) -> int:
 
 def _part2(parsed_input) -> int:
     grid = parsed_input
+    cells = grid.cells
+    neighbours = grid.neighbours4
 
     result = 0
-    for start in grid.find_all("0"):
+    for start in grid.find_indices("0"):
         todo = [start]
-        seen: set[Coordinate] = set()
         endpoints = {}
 
         while todo:
             current_pos = todo.pop()
 
-            height = grid.get(current_pos)
-            if height == "9":
+            height = cells[current_pos]
+            if height == SUMMIT:
                 if current_pos in endpoints:
                     endpoints[current_pos] += 1
                 else:
                     endpoints[current_pos] = 1
                 continue
 
-            seen.add(current_pos)
-
-            options = grid.neighbours(current_pos, include_diagonals=False)
-            expected_height = str(int(height) + 1)
-            todo += [x for x in options if grid.get(x) == expected_height]
+            expected_height = height + 1
+            todo += [x for x in neighbours[current_pos] if cells[x] == expected_height]
 
         result += sum(endpoints.values())
 
@@ -3,12 +3,15 @@
 import heapq
 import math
 
-from .utilities import parse_ints, take_n, Coordinate, Grid
+from .utilities import parse_ints, take_n, Coordinate, FlatGrid
+
+
+WALL = ord("#")
 
 
 def coordinates_to_grid(cs: list[(Coordinate, Coordinate)], limit: int):
     x_max = y_max = 71
-    grid = Grid(["." * x_max] * y_max)
+    grid = FlatGrid(["." * x_max] * y_max)
     for n, c in enumerate(cs):
         if n >= limit:
             break
@@ -18,13 +21,17 @@ def coordinates_to_grid(cs: list[(Coordinate, Coordinate)], limit: int):
 
 
 def dijkstra(grid, start, end):
+    """Shortest path from start to end, with the previous nodes as flat indices."""
+    start = grid.index(start)
+    end = grid.index(end)
+    cells = grid.cells
+    neighbours = grid.neighbours4
+
     queue = [(0, start)]
     heapq.heapify(queue)
-    distances = {
-        (x, y): math.inf for x in range(grid.columns) for y in range(grid.rows)
-    }
+    distances = [math.inf] * len(grid)
     distances[start] = 0
-    previous = {(x, y): None for x in range(grid.columns) for y in range(grid.rows)}
+    previous = [None] * len(grid)
     visited = set()
 
     while queue:
@@ -36,8 +43,8 @@ def dijkstra(grid, start, end):
         if node == end:
             return (cost, previous)
 
-        for new_node in grid.neighbours(node, include_diagonals=False):
-            if grid.get(new_node) == "#":
+        for new_node in neighbours[node]:
+            if cells[new_node] == WALL:
                 continue
 
             new_cost = cost + 1
@@ -5,25 +5,29 @@ import math
 import collections
 
 
-from .utilities import Grid
+from .utilities import FlatGrid
+
+WALL = ord("#")
 
 
 def _parse(input_data: str):
-    grid = Grid(input_data.splitlines())
-    start = grid.find("S")
-    end = grid.find("E")
+    grid = FlatGrid(input_data.splitlines())
+    start = grid.index(grid.find("S"))
+    end = grid.index(grid.find("E"))
 
     return (grid, start, end)
 
 
 def dijkstra(grid, start, end):
+    """Shortest path on the flat indices of the grid, start and end included."""
+    cells = grid.cells
+    neighbours = grid.neighbours4
+
     queue = [(0, start)]
     heapq.heapify(queue)
-    distances = {
-        (x, y): math.inf for x in range(grid.columns) for y in range(grid.rows)
-    }
+    distances = [math.inf] * len(grid)
     distances[start] = 0
-    previous = {(x, y): None for x in range(grid.columns) for y in range(grid.rows)}
+    previous = [None] * len(grid)
     visited = set()
 
     while queue:
@@ -35,8 +39,8 @@ def dijkstra(grid, start, end):
         if node == end:
             return (cost, previous)
 
-        for new_node in grid.neighbours(node, include_diagonals=False):
-            if grid.get(new_node) == "#":
+        for new_node in neighbours[node]:
+            if cells[new_node] == WALL:
                 continue
 
             new_cost = cost + 1
@@ -85,17 +89,9 @@ def _part1(parsed_input) -> int:
 
     cheat_options = set()
     for node in path:
-        walls = [
-            x
-            for x in grid.neighbours(node, include_diagonals=False)
-            if grid.get(x) == "#"
-        ]
+        walls = [x for x in grid.neighbours4[node] if grid.cells[x] == WALL]
         for w in walls:
-            options = [
-                x
-                for x in grid.neighbours(w, include_diagonals=False)
-                if x in path and x != node
-            ]
+            options = [x for x in grid.neighbours4[w] if x in path and x != node]
             for option in options:
                 cheat_options.add((node, option))
 
@@ -126,19 +122,22 @@ def _part2(parsed_input) -> int:
     _, previous = dijkstra(grid, start, end)
     path = generate_path(previous, start, end)
     path.reverse()
+    # (x, y) tuples rather than coordinates, hashed in C and unpacked without
+    # attribute lookups in the loop below
+    path = [divmod(node, grid.columns)[::-1] for node in path]
 
-    path_with_index = {(c.x, c.y): i for i, c in enumerate(path)}
+    path_with_index = {p: i for i, p in enumerate(path)}
     valid_nodes = path_with_index.keys()
 
     radius = 20
     count = collections.Counter()
-    for node in path:
-        n = (node.x, node.y)
+    for n in path:
+        x, y = n
         points_in_range = [
-            (node.x + dx, node.y + dy)
+            (x + dx, y + dy)
             for dx in range(-radius, radius + 1)
             for dy in range(-(radius - abs(dx)), radius - abs(dx) + 1)
-            if (node.x + dx, node.y + dy) in valid_nodes
+            if (x + dx, y + dy) in valid_nodes
         ]
         for p in points_in_range:
             time_saved = path_with_index[p] - path_with_index[n] - distance(n, p)
@@ -1,5 +1,6 @@
 """Generic helpers"""
 
+import functools
 import itertools
 import re
 import typing
@@ -43,46 +44,55 @@ def transpose_2d_list(l):
     return list(map(list, zip(*l)))
 
 
-class Coordinate:
-    """Represent a single point within a 2D space."""
+# Registry of the hot paths counted by python -m aoc run --count-calls, see
+# aoc/counting.py.
+HOT_PATHS = []
+
+
+def hot_path(function):
+    HOT_PATHS.append(function)
+    return function
 
-    x: int
-    y: int
 
-    def __init__(self, x, y) -> "Coordinate":
-        self.x = x
-        self.y = y
+# Creates a coordinate without calling the named tuple __new__, see the
+# coordinate benchmark in aoc/microbench.py.
+_new_tuple = tuple.__new__
 
-    def __hash__(self) -> int:
-        return hash((self.x, self.y))
+
+class Coordinate(typing.NamedTuple):
+    """Represent a single point within a 2D space.
+
+    Backed by a tuple, so it is immutable without a per instance __dict__, hashed
+    and compared in C (as the tuple (x, y), which it equals) and sorted by x, then y.
+    Adding a tuple to a coordinate, in either order, adds the coordinates rather
+    than concatenating them.
+    """
+
+    # pylint does not see that a named tuple is subscriptable
+    # pylint: disable=unsubscriptable-object
+
+    x: int
+    y: int
 
     def __repr__(self) -> str:
         return f"<Coordinate x: {self.x}, y:{self.y}>"
 
+    @hot_path
     def __add__(self, other: "Coordinate") -> "Coordinate":
-        return Coordinate(self.x + other.x, self.y + other.y)
+        return _new_tuple(Coordinate, (self[0] + other[0], self[1] + other[1]))
 
-    def __sub__(self, other: "Coordinate") -> "Coordinate":
-        return Coordinate(self.x - other.x, self.y - other.y)
+    __radd__ = __add__
 
-    def __mul__(self, other):
-        if isinstance(other, int):
-            return Coordinate(self.x * other, self.y * other)
-        raise TypeError
+    @hot_path
+    def __sub__(self, other: "Coordinate") -> "Coordinate":
+        return _new_tuple(Coordinate, (self[0] - other[0], self[1] - other[1]))
 
-    def __rmul__(self, other):
+    def __mul__(self, other: int) -> "Coordinate":
         if isinstance(other, int):
-            return Coordinate(self.x * other, self.y * other)
+            return _new_tuple(Coordinate, (self[0] * other, self[1] * other))
         raise TypeError
 
-    def __eq__(self, other: "Coordinate") -> bool:
-        try:
-            return self.x == other.x and self.y == other.y
-        except AttributeError:
-            return self.x == other[0] and self.y == other[1]
-
-    def __lt__(self, other: "Coordinate") -> bool:
-        return (self.x, self.y) < (other.x, other.y)
+    __rmul__ = __mul__
 
     def neighbours(self) -> typing.Generator["Coordinate", None, None]:
         deltas = [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
@@ -122,6 +132,7 @@ class Grid:
         index = coordinate.x + self._stride * coordinate.y
         self._data[index] = value
 
+    @hot_path
     def get(self, coordinate: Coordinate):
         index = coordinate.x + self._stride * coordinate.y
         return self._data[index]
@@ -137,6 +148,7 @@ class Grid:
         for i in indices:
             yield Coordinate(i % self._stride, i // self._stride)
 
+    @hot_path
     def neighbours(
         self, coordinate: Coordinate, include_diagonals=True
     ) -> typing.Generator[Coordinate, None, None]:
@@ -163,18 +175,231 @@ class Grid:
         return abs(p1.x - p2.x) + abs(p1.y - p2.y)
 
 
+# Same order as Grid.neighbours, so searches visit the neighbours alike
+_DELTAS_4 = ((0, 1), (0, -1), (1, 0), (-1, 0))
+_DELTAS_8 = _DELTAS_4 + ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def _neighbour_table(rows: int, columns: int, deltas) -> tuple[tuple[int, ...], ...]:
+    """In-bounds neighbour indices of every flat index of a grid.
+
+    All cells get every neighbour first, zipping shifted ranges of the indices in
+    C, then the cells on the edges are replaced by their in-bounds neighbours only.
+    """
+    size = rows * columns
+    offsets = [dy * columns + dx for dx, dy in deltas]
+    table = list(zip(*(range(offset, size + offset) for offset in offsets)))
+    edges = {
+        *range(columns),
+        *range(size - columns, size),
+        *range(0, size, columns),
+        *range(columns - 1, size, columns),
+    }
+    for index in edges:
+        y, x = divmod(index, columns)
+        table[index] = tuple(
+            (y + dy) * columns + x + dx
+            for dx, dy in deltas
+            if 0 <= x + dx < columns and 0 <= y + dy < rows
+        )
+    return tuple(table)
+
+
+class FlatGrid:
+    """Represent a 2D grid of single byte characters, addressed by flat indices.
+
+    The cells are stored row by row in a bytearray, index = x + columns * y, with
+    their byte values (ord("#")). The in-bounds neighbours of every index are
+    computed once, so searches iterate over them without creating coordinates:
+
+        for n in grid.neighbours4[index]:
+            if grid.cells[n] != WALL: ...
+
+    The neighbour tables are computed on first use, a large grid (a million
+    cells) takes a few tenths of a second and a few hundred MB per table, so a
+    grid only pays for the tables it uses.
+
+    The Coordinate API of Grid (get, set, find, find_all, neighbours) is kept as
+    an adapter on top, working with characters.
+    """
+
+    def __init__(self, data):
+        self.rows = len(data)
+        self.columns = len(data[0])
+        self.cells = bytearray("".join(data), "ascii")
+
+    @functools.cached_property
+    def neighbours4(self) -> tuple[tuple[int, ...], ...]:
+        return _neighbour_table(self.rows, self.columns, _DELTAS_4)
+
+    @functools.cached_property
+    def neighbours8(self) -> tuple[tuple[int, ...], ...]:
+        return _neighbour_table(self.rows, self.columns, _DELTAS_8)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __repr__(self) -> str:
+        return f"<FlatGrid rows: {self.rows}, columns: {self.columns}>"
+
+    def __str__(self) -> str:
+        return "\n".join(
+            self.cells[i : i + self.columns].decode("ascii")
+            for i in range(0, len(self.cells), self.columns)
+        )
+
+    def index(self, coordinate: Coordinate) -> int:
+        return coordinate.x + self.columns * coordinate.y
+
+    def coordinate(self, index: int) -> Coordinate:
+        y, x = divmod(index, self.columns)
+        return Coordinate(x, y)
+
+    def set(self, coordinate: Coordinate, value: str) -> None:
+        self.cells[self.index(coordinate)] = ord(value)
+
+    def get(self, coordinate: Coordinate) -> str:
+        return chr(self.cells[self.index(coordinate)])
+
+    def find(self, needle: str) -> Coordinate:
+        index = self.cells.find(ord(needle))
+        if index < 0:
+            raise ValueError(f"{needle!r} is not in the grid")
+        return self.coordinate(index)
+
+    def find_indices(self, needle: str) -> typing.Generator[int, None, None]:
+        value = ord(needle)
+        index = self.cells.find(value)
+        while index >= 0:
+            yield index
+            index = self.cells.find(value, index + 1)
+
+    def find_all(self, needle: str) -> typing.Generator[Coordinate, None, None]:
+        for index in self.find_indices(needle):
+            yield self.coordinate(index)
+
+    def neighbours(
+        self, coordinate: Coordinate, include_diagonals=True
+    ) -> typing.Generator[Coordinate, None, None]:
+        table = self.neighbours8 if include_diagonals else self.neighbours4
+        for index in table[self.index(coordinate)]:
+            yield self.coordinate(index)
+
+
+# numpy is optional and slow to import (about 0.1s), it is imported by the first
+# ArrayGrid rather than by every day importing the utilities
+np = None  # pylint: disable=invalid-name
+
+
+def _import_numpy() -> None:
+    global np  # pylint: disable=global-statement
+    if np is None:
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        np = numpy
+
+
+class ArrayGrid:
+    """Represent a 2D grid of single byte characters as a NumPy uint8 array.
+
+    Whole grid passes are array operations rather than loops over the cells: a
+    mask of the cells holding a character, the same mask shifted by a delta (the
+    neighbour in that direction of every cell at once), neighbour counts and
+    counts per row or column. The cells are indexed as cells[y, x].
+
+    Requires numpy, which is optional: the other utilities work without it.
+    """
+
+    def __init__(self, data):
+        _import_numpy()
+        text = "".join(data).encode("ascii")
+        self.cells = np.frombuffer(text, dtype=np.uint8).reshape(len(data), -1).copy()
+        self.rows, self.columns = self.cells.shape
+
+    def __repr__(self) -> str:
+        return f"<ArrayGrid rows: {self.rows}, columns: {self.columns}>"
+
+    def __str__(self) -> str:
+        return "\n".join(row.tobytes().decode("ascii") for row in self.cells)
+
+    def get(self, coordinate: Coordinate) -> str:
+        return chr(self.cells[coordinate[1], coordinate[0]])
+
+    def set(self, coordinate: Coordinate, value: str) -> None:
+        self.cells[coordinate[1], coordinate[0]] = ord(value)
+
+    def mask(self, needle: str) -> "np.ndarray":
+        """Boolean array, True where the cell holds the needle."""
+        return self.cells == ord(needle)
+
+    def count(self, needle: str) -> int:
+        return int(np.count_nonzero(self.mask(needle)))
+
+    def find_all(self, needle: str) -> typing.Generator[Coordinate, None, None]:
+        """Coordinates of the needle, row by row like Grid.find_all."""
+        ys, xs = np.nonzero(self.mask(needle))
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            yield Coordinate(x, y)
+
+    @staticmethod
+    def shifted(array: "np.ndarray", dx: int, dy: int, fill=0) -> "np.ndarray":
+        """The array moved so every cell holds its neighbour at (dx, dy).
+
+        result[y, x] == array[y + dy, x + dx], and fill where that is off the grid.
+        """
+        rows, columns = array.shape
+        result = np.full_like(array, fill)
+        if abs(dx) < columns and abs(dy) < rows:
+            result[
+                max(-dy, 0) : rows - max(dy, 0), max(-dx, 0) : columns - max(dx, 0)
+            ] = array[max(dy, 0) : rows + min(dy, 0), max(dx, 0) : columns + min(dx, 0)]
+        return result
+
+    @staticmethod
+    def neighbour_counts(mask: "np.ndarray", include_diagonals=True) -> "np.ndarray":
+        """Number of neighbours of every cell that are set in the mask.
+
+        A convolution with a 3x3 kernel of ones (without the centre, or only the
+        4 orthogonal neighbours), summing the shifted masks.
+        """
+        counts = np.zeros(mask.shape, dtype=np.uint8)
+        for dx, dy in _DELTAS_8 if include_diagonals else _DELTAS_4:
+            counts += ArrayGrid.shifted(mask, dx, dy)
+        return counts
+
+    def row_counts(self, needle: str) -> "np.ndarray":
+        """Number of cells holding the needle in every row."""
+        return np.count_nonzero(self.mask(needle), axis=1)
+
+    def column_counts(self, needle: str) -> "np.ndarray":
+        """Number of cells holding the needle in every column."""
+        return np.count_nonzero(self.mask(needle), axis=0)
+
+
 class SparseGrid:
-    """A spare grid representation, only storing specific values and their coordinates."""
+    """A spare grid representation, only storing specific values and their coordinates.
+
+    Next to the values by coordinate, the coordinates are indexed by value, so
+    find and find_all do not scan the grid. Both are kept in sync by set, remove
+    and pop_front; change the grid through those, not through _data.
+
+    Constraints:
+    * the values are keys of the index, so they must be hashable
+    * keys() is a live view rather than a copy, iterating over it while changing
+      the grid raises RuntimeError, iterate over list(grid.keys()) instead
+    """
 
     def __init__(self, data=None, predicate=lambda x: True):
-        """TODO: datatype of self._data"""
-        self._data = {}
+        self._data: dict[Coordinate, typing.Any] = {}
+        # value -> coordinates holding it, as the keys of a dict to keep them in
+        # the order they were set
+        self._index: dict[typing.Any, dict[Coordinate, None]] = {}
 
         if not data is None:
             for r, row in enumerate(data):
                 for c, ch in enumerate(row):
                     if predicate(ch):
-                        self._data[Coordinate(c, r)] = ch
+                        self.set(Coordinate(c, r), ch)
             self.rows = len(data)
             self.columns = len(data[0])
 
@@ -184,55 +409,66 @@ class SparseGrid:
     def __len__(self) -> int:
         return len(self._data)
 
+    def __contains__(self, coordinate: Coordinate) -> bool:
+        return coordinate in self._data
+
     def pop_front(self):
-        c = list(self._data)[0]
-        v = self._data.pop(c)
-        return (c, v)
+        c = next(iter(self._data))
+        return (c, self._pop(c))
 
     def keys(self):
-        return set(self._data.keys())
+        """Live view of the coordinates, following later changes of the grid."""
+        return self._data.keys()
 
     def values(self):
         return self._data.values()
 
     def find(self, needle) -> Coordinate:
-        for c, v in self._data.items():
-            if v == needle:
-                return c
-        raise IndexError
+        coordinates = self._index.get(needle)
+        if not coordinates:
+            raise IndexError
+        return next(iter(coordinates))
 
     def find_all(self, needle) -> typing.Generator["Coordinate", None, None]:
-        for c, value in self._data.items():
-            if value == needle:
-                yield c
+        # a copy, so the grid can be changed while iterating
+        yield from list(self._index.get(needle, ()))
 
     def front(self):
-        c = list(self._data)[0]
-        v = self._data[c]
-        return (c, v)
+        c = next(iter(self._data))
+        return (c, self._data[c])
 
+    @hot_path
     def get(self, coordinate: Coordinate):
         return self._data[coordinate]
 
     def set(self, coordinate: Coordinate, value):
+        if coordinate in self._data:
+            self._unindex(coordinate, self._data[coordinate])
         self._data[coordinate] = value
+        self._index.setdefault(value, {})[coordinate] = None
 
+    @hot_path
     def neighbours(
         self, coordinate: Coordinate, include_diagonals=True
     ) -> typing.Generator[Coordinate, None, None]:
-        deltas = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-        if include_diagonals:
-            deltas += [(1, 1), (1, -1), (-1, 1), (-1, -1)]
-
-        for delta in deltas:
-            x = coordinate.x + delta[0]
-            y = coordinate.y + delta[1]
-            c = Coordinate(x, y)
-            if 0 <= x < self.rows and 0 <= y < self.columns and c in self.keys():
+        x, y = coordinate.x, coordinate.y
+        data = self._data
+        for dx, dy in _DELTAS_8 if include_diagonals else _DELTAS_4:
+            c = _new_tuple(Coordinate, (x + dx, y + dy))
+            if c in data:
                 yield c
-            else:
-                continue
 
     def remove(self, coordinate: Coordinate):
-        if coordinate in self.keys():
-            self._data.pop(coordinate)
+        if coordinate in self._data:
+            self._pop(coordinate)
+
+    def _pop(self, coordinate: Coordinate):
+        value = self._data.pop(coordinate)
+        self._unindex(coordinate, value)
+        return value
+
+    def _unindex(self, coordinate: Coordinate, value) -> None:
+        coordinates = self._index[value]
+        del coordinates[coordinate]
+        if not coordinates:
+            del self._index[value]
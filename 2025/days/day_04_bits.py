@@ -0,0 +1,53 @@
+"""Day 4: Printing Department, on row bitmasks
+
+Part 1:
+    The rolls are stored as one int bitmask per row. The rolls with fewer than 4 adjacent rolls are
+    found for a whole row at once, adding up the shifted neighbour rows with bitwise adders.
+
+Part 2:
+    Every round removes all accessible rolls with a single AND NOT per row, until no roll can be removed.
+"""
+
+from .utilities import BitGrid
+
+FEWER_THAN_4 = range(4)
+
+
+def _parse(input_data: str):
+    return BitGrid("".join(input_data).splitlines(), predicate=lambda x: x == "@")
+
+
+def _part1(rolls: BitGrid) -> int:
+    return (rolls & rolls.with_neighbours(FEWER_THAN_4)).count()
+
+
+def _part2(rolls: BitGrid) -> int:
+    result = 0
+
+    while True:
+        to_be_removed = rolls & rolls.with_neighbours(FEWER_THAN_4)
+        removed = to_be_removed.count()
+        if not removed:
+            break
+
+        result += removed
+        rolls = rolls - to_be_removed
+
+    return result
+
+
+def solve(input_data: str) -> tuple[int, int]:
+    parsed_input = _parse(input_data)
+    return (_part1(parsed_input), _part2(parsed_input))
+
+
+if __name__ == "__main__":
+    from aocd.models import Puzzle
+
+    puzzle = Puzzle(year=2025, day=4)
+    example = puzzle.examples[0]
+    example_input = example.input_data
+
+    solution = solve(example_input)
+    print(f"Part 1: {solution[0]}, expecting: {example.answer_a}")
+    print(f"Part 2: {solution[1]}, expecting: {example.answer_b}")
@@ -0,0 +1,60 @@
+"""Day 4: Printing Department, on a NumPy array
+
+Part 1:
+    Instead of counting the adjacent rolls of every roll one by one, the mask of the rolls is shifted
+    in all 8 directions and summed, giving the number of adjacent rolls of every cell at once.
+
+Part 2:
+    Every round removes all accessible rolls from the mask at once and counts the neighbours again,
+    until no roll can be removed.
+"""
+
+import numpy as np
+
+from .utilities import ArrayGrid
+
+
+def _parse(input_data: str):
+    return ArrayGrid("".join(input_data).splitlines())
+
+
+def _accessible(rolls) -> np.ndarray:
+    max_rolls = 4
+    return rolls & (ArrayGrid.neighbour_counts(rolls) < max_rolls)
+
+
+def _part1(grid) -> int:
+    return int(np.count_nonzero(_accessible(grid.mask("@"))))
+
+
+def _part2(grid) -> int:
+    rolls = grid.mask("@")
+    result = 0
+
+    while True:
+        to_be_removed = _accessible(rolls)
+        removed = int(np.count_nonzero(to_be_removed))
+        if not removed:
+            break
+
+        result += removed
+        rolls &= ~to_be_removed
+
+    return result
+
+
+def solve(input_data: str) -> tuple[int, int]:
+    parsed_input = _parse(input_data)
+    return (_part1(parsed_input), _part2(parsed_input))
+
+
+if __name__ == "__main__":
+    from aocd.models import Puzzle
+
+    puzzle = Puzzle(year=2025, day=4)
+    example = puzzle.examples[0]
+    example_input = example.input_data
+
+    solution = solve(example_input)
+    print(f"Part 1: {solution[0]}, expecting: {example.answer_a}")
+    print(f"Part 2: {solution[1]}, expecting: {example.answer_b}")
@@ -2,47 +2,55 @@
 
 import typing
 
+# Registry of the hot paths counted by python -m aoc run --count-calls, see
+# aoc/counting.py.
+HOT_PATHS = []
 
-class Coordinate:
-    """Represent a single point within a 2D space."""
 
-    x: int
-    y: int
+def hot_path(function):
+    HOT_PATHS.append(function)
+    return function
+
+
+# Creates a coordinate without calling the named tuple __new__, see the
+# coordinate benchmark in aoc/microbench.py.
+_new_tuple = tuple.__new__
+
 
-    def __init__(self, x, y) -> "Coordinate":
-        self.x = x
-        self.y = y
+class Coordinate(typing.NamedTuple):
+    """Represent a single point within a 2D space.
 
-    def __hash__(self) -> int:
-        return hash((self.x, self.y))
+    Backed by a tuple, so it is immutable without a per instance __dict__, hashed
+    and compared in C (as the tuple (x, y), which it equals) and sorted by x, then y.
+    Adding a tuple to a coordinate, in either order, adds the coordinates rather
+    than concatenating them.
+    """
+
+    # pylint does not see that a named tuple is subscriptable
+    # pylint: disable=unsubscriptable-object
+
+    x: int
+    y: int
 
     def __repr__(self) -> str:
         return f"<Coordinate x: {self.x}, y:{self.y}>"
 
+    @hot_path
     def __add__(self, other: "Coordinate") -> "Coordinate":
-        return Coordinate(self.x + other.x, self.y + other.y)
+        return _new_tuple(Coordinate, (self[0] + other[0], self[1] + other[1]))
 
-    def __sub__(self, other: "Coordinate") -> "Coordinate":
-        return Coordinate(self.x - other.x, self.y - other.y)
+    __radd__ = __add__
 
-    def __mul__(self, other):
-        if isinstance(other, int):
-            return Coordinate(self.x * other, self.y * other)
-        raise TypeError
+    @hot_path
+    def __sub__(self, other: "Coordinate") -> "Coordinate":
+        return _new_tuple(Coordinate, (self[0] - other[0], self[1] - other[1]))
 
-    def __rmul__(self, other):
+    def __mul__(self, other: int) -> "Coordinate":
         if isinstance(other, int):
-            return Coordinate(self.x * other, self.y * other)
+            return _new_tuple(Coordinate, (self[0] * other, self[1] * other))
         raise TypeError
 
-    def __eq__(self, other: "Coordinate") -> bool:
-        try:
-            return self.x == other.x and self.y == other.y
-        except AttributeError:
-            return self.x == other[0] and self.y == other[1]
-
-    def __lt__(self, other: "Coordinate") -> bool:
-        return (self.x, self.y) < (other.x, other.y)
+    __rmul__ = __mul__
 
     def neighbours(self) -> typing.Generator["Coordinate", None, None]:
         deltas = [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
@@ -50,18 +58,35 @@ class Coordinate:
             yield Coordinate(self.x + delta[0], self.y + delta[1])
 
 
+# Neighbour deltas, the diagonal ones last
+_DELTAS_4 = ((0, 1), (0, -1), (1, 0), (-1, 0))
+_DELTAS_8 = _DELTAS_4 + ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
 class SparseGrid:
-    """A spare grid representation, only storing specific values and their coordinates."""
+    """A spare grid representation, only storing specific values and their coordinates.
+
+    Next to the values by coordinate, the coordinates are indexed by value, so
+    find and find_all do not scan the grid. Both are kept in sync by set, remove
+    and pop_front; change the grid through those, not through _data.
+
+    Constraints:
+    * the values are keys of the index, so they must be hashable
+    * keys() is a live view rather than a copy, iterating over it while changing
+      the grid raises RuntimeError, iterate over list(grid.keys()) instead
+    """
 
     def __init__(self, data=None, predicate=lambda x: True):
-        """TODO: datatype of self._data"""
-        self._data = {}
+        self._data: dict[Coordinate, typing.Any] = {}
+        # value -> coordinates holding it, as the keys of a dict to keep them in
+        # the order they were set
+        self._index: dict[typing.Any, dict[Coordinate, None]] = {}
 
         if not data is None:
             for r, row in enumerate(data):
                 for c, ch in enumerate(row):
                     if predicate(ch):
-                        self._data[Coordinate(c, r)] = ch
+                        self.set(Coordinate(c, r), ch)
             self.rows = len(data)
             self.columns = len(data[0])
 
@@ -71,55 +96,286 @@ class SparseGrid:
     def __len__(self) -> int:
         return len(self._data)
 
+    def __contains__(self, coordinate: Coordinate) -> bool:
+        return coordinate in self._data
+
     def pop_front(self):
-        c = list(self._data)[0]
-        v = self._data.pop(c)
-        return (c, v)
+        c = next(iter(self._data))
+        return (c, self._pop(c))
 
     def keys(self):
-        return set(self._data.keys())
+        """Live view of the coordinates, following later changes of the grid."""
+        return self._data.keys()
 
     def values(self):
         return self._data.values()
 
     def find(self, needle) -> Coordinate:
-        for c, v in self._data.items():
-            if v == needle:
-                return c
-        raise IndexError
+        coordinates = self._index.get(needle)
+        if not coordinates:
+            raise IndexError
+        return next(iter(coordinates))
 
     def find_all(self, needle) -> typing.Generator["Coordinate", None, None]:
-        for c, value in self._data.items():
-            if value == needle:
-                yield c
+        # a copy, so the grid can be changed while iterating
+        yield from list(self._index.get(needle, ()))
 
     def front(self):
-        c = list(self._data)[0]
-        v = self._data[c]
-        return (c, v)
+        c = next(iter(self._data))
+        return (c, self._data[c])
 
+    @hot_path
     def get(self, coordinate: Coordinate):
         return self._data[coordinate]
 
     def set(self, coordinate: Coordinate, value):
+        if coordinate in self._data:
+            self._unindex(coordinate, self._data[coordinate])
         self._data[coordinate] = value
+        self._index.setdefault(value, {})[coordinate] = None
 
+    @hot_path
     def neighbours(
         self, coordinate: Coordinate, include_diagonals=True
     ) -> typing.Generator[Coordinate, None, None]:
-        deltas = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-        if include_diagonals:
-            deltas += [(1, 1), (1, -1), (-1, 1), (-1, -1)]
-
-        for delta in deltas:
-            x = coordinate.x + delta[0]
-            y = coordinate.y + delta[1]
-            c = Coordinate(x, y)
-            if 0 <= x < self.rows and 0 <= y < self.columns and c in self.keys():
+        x, y = coordinate.x, coordinate.y
+        data = self._data
+        for dx, dy in _DELTAS_8 if include_diagonals else _DELTAS_4:
+            c = _new_tuple(Coordinate, (x + dx, y + dy))
+            if c in data:
                 yield c
-            else:
-                continue
 
     def remove(self, coordinate: Coordinate):
-        if coordinate in self.keys():
-            self._data.pop(coordinate)
+        if coordinate in self._data:
+            self._pop(coordinate)
+
+    def _pop(self, coordinate: Coordinate):
+        value = self._data.pop(coordinate)
+        self._unindex(coordinate, value)
+        return value
+
+    def _unindex(self, coordinate: Coordinate, value) -> None:
+        coordinates = self._index[value]
+        del coordinates[coordinate]
+        if not coordinates:
+            del self._index[value]
+
+
+# numpy is optional and slow to import (about 0.1s), it is imported by the first
+# ArrayGrid rather than by every day importing the utilities
+np = None  # pylint: disable=invalid-name
+
+
+def _import_numpy() -> None:
+    global np  # pylint: disable=global-statement
+    if np is None:
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        np = numpy
+
+
+class ArrayGrid:
+    """Represent a 2D grid of single byte characters as a NumPy uint8 array.
+
+    Whole grid passes are array operations rather than loops over the cells: a
+    mask of the cells holding a character, the same mask shifted by a delta (the
+    neighbour in that direction of every cell at once), neighbour counts and
+    counts per row or column. The cells are indexed as cells[y, x].
+
+    Requires numpy, which is optional: the other utilities work without it.
+    """
+
+    def __init__(self, data):
+        _import_numpy()
+        text = "".join(data).encode("ascii")
+        self.cells = np.frombuffer(text, dtype=np.uint8).reshape(len(data), -1).copy()
+        self.rows, self.columns = self.cells.shape
+
+    def __repr__(self) -> str:
+        return f"<ArrayGrid rows: {self.rows}, columns: {self.columns}>"
+
+    def __str__(self) -> str:
+        return "\n".join(row.tobytes().decode("ascii") for row in self.cells)
+
+    def get(self, coordinate: Coordinate) -> str:
+        return chr(self.cells[coordinate[1], coordinate[0]])
+
+    def set(self, coordinate: Coordinate, value: str) -> None:
+        self.cells[coordinate[1], coordinate[0]] = ord(value)
+
+    def mask(self, needle: str) -> "np.ndarray":
+        """Boolean array, True where the cell holds the needle."""
+        return self.cells == ord(needle)
+
+    def count(self, needle: str) -> int:
+        return int(np.count_nonzero(self.mask(needle)))
+
+    def find_all(self, needle: str) -> typing.Generator[Coordinate, None, None]:
+        """Coordinates of the needle, row by row like Grid.find_all."""
+        ys, xs = np.nonzero(self.mask(needle))
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            yield Coordinate(x, y)
+
+    @staticmethod
+    def shifted(array: "np.ndarray", dx: int, dy: int, fill=0) -> "np.ndarray":
+        """The array moved so every cell holds its neighbour at (dx, dy).
+
+        result[y, x] == array[y + dy, x + dx], and fill where that is off the grid.
+        """
+        rows, columns = array.shape
+        result = np.full_like(array, fill)
+        if abs(dx) < columns and abs(dy) < rows:
+            result[
+                max(-dy, 0) : rows - max(dy, 0), max(-dx, 0) : columns - max(dx, 0)
+            ] = array[max(dy, 0) : rows + min(dy, 0), max(dx, 0) : columns + min(dx, 0)]
+        return result
+
+    @staticmethod
+    def neighbour_counts(mask: "np.ndarray", include_diagonals=True) -> "np.ndarray":
+        """Number of neighbours of every cell that are set in the mask.
+
+        A convolution with a 3x3 kernel of ones (without the centre, or only the
+        4 orthogonal neighbours), summing the shifted masks.
+        """
+        counts = np.zeros(mask.shape, dtype=np.uint8)
+        for dx, dy in _DELTAS_8 if include_diagonals else _DELTAS_4:
+            counts += ArrayGrid.shifted(mask, dx, dy)
+        return counts
+
+    def row_counts(self, needle: str) -> "np.ndarray":
+        """Number of cells holding the needle in every row."""
+        return np.count_nonzero(self.mask(needle), axis=1)
+
+    def column_counts(self, needle: str) -> "np.ndarray":
+        """Number of cells holding the needle in every column."""
+        return np.count_nonzero(self.mask(needle), axis=0)
+
+
+class BitGrid:
+    """Represent a 2D grid of yes/no cells as one int bitmask per row.
+
+    Bit x of bits[y] is the cell (x, y). Whole grid operations work on entire rows
+    at once: & | - ~ combine grids of the same size, count is a popcount and
+    neighbour counts add up the shifted rows with bitwise adders.
+    """
+
+    def __init__(self, data=None, predicate=lambda x: x == "#"):
+        self.bits: list[int] = []
+        self.rows = 0
+        self.columns = 0
+
+        if not data is None:
+            self.rows = len(data)
+            self.columns = len(data[0])
+            for row in data:
+                self.bits.append(
+                    sum(1 << x for x, ch in enumerate(row) if predicate(ch))
+                )
+        self.full = (1 << self.columns) - 1
+
+    def _like(self, bits: list[int]) -> "BitGrid":
+        grid = BitGrid()
+        grid.bits = bits
+        grid.rows = self.rows
+        grid.columns = self.columns
+        grid.full = self.full
+        return grid
+
+    def __repr__(self) -> str:
+        return f"<BitGrid rows: {self.rows}, columns: {self.columns}>"
+
+    def __str__(self) -> str:
+        return "\n".join(
+            "".join("#" if row >> x & 1 else "." for x in range(self.columns))
+            for row in self.bits
+        )
+
+    def __eq__(self, other: "BitGrid") -> bool:
+        if not isinstance(other, BitGrid):
+            return NotImplemented
+        return (self.rows, self.columns, self.bits) == (
+            other.rows,
+            other.columns,
+            other.bits,
+        )
+
+    def _rows_of(self, other: "BitGrid") -> list[int]:
+        if (self.rows, self.columns) != (other.rows, other.columns):
+            raise ValueError(
+                f"Can not combine a {self.rows}x{self.columns} grid with a "
+                f"{other.rows}x{other.columns} grid"
+            )
+        return other.bits
+
+    def __and__(self, other: "BitGrid") -> "BitGrid":
+        return self._like([a & b for a, b in zip(self.bits, self._rows_of(other))])
+
+    def __or__(self, other: "BitGrid") -> "BitGrid":
+        return self._like([a | b for a, b in zip(self.bits, self._rows_of(other))])
+
+    def __sub__(self, other: "BitGrid") -> "BitGrid":
+        return self._like([a & ~b for a, b in zip(self.bits, self._rows_of(other))])
+
+    def __invert__(self) -> "BitGrid":
+        return self._like([~row & self.full for row in self.bits])
+
+    def __contains__(self, coordinate: Coordinate) -> bool:
+        x, y = coordinate
+        return 0 <= y < self.rows and 0 <= x < self.columns and self.bits[y] >> x & 1
+
+    def __iter__(self) -> typing.Generator[Coordinate, None, None]:
+        for y, row in enumerate(self.bits):
+            while row:
+                low = row & -row
+                yield Coordinate(low.bit_length() - 1, y)
+                row ^= low
+
+    def count(self) -> int:
+        return sum(row.bit_count() for row in self.bits)
+
+    def set(self, coordinate: Coordinate) -> None:
+        self.bits[coordinate[1]] |= 1 << coordinate[0]
+
+    def remove(self, coordinate: Coordinate) -> None:
+        self.bits[coordinate[1]] &= ~(1 << coordinate[0])
+
+    def with_neighbours(
+        self, counts: typing.Container[int], include_diagonals=True
+    ) -> "BitGrid":
+        """Cells, set or not, whose number of set neighbours is one of counts.
+
+        The neighbour rows shifted by one column are added as bit-sliced counters:
+        planes[i] holds bit i of the count of every cell of a row, so a row takes a
+        few int operations regardless of its width.
+        """
+        full = self.full
+        empty = [0]
+        padded = empty + self.bits + empty
+        result = []
+        for y in range(1, self.rows + 1):
+            above, row, below = padded[y - 1], padded[y], padded[y + 1]
+            neighbours = [above, below, (row << 1) & full, row >> 1]
+            if include_diagonals:
+                neighbours += [
+                    (above << 1) & full,
+                    above >> 1,
+                    (below << 1) & full,
+                    below >> 1,
+                ]
+
+            planes = [0, 0, 0, 0]
+            for carry in neighbours:
+                for i, plane in enumerate(planes):
+                    if not carry:
+                        break
+                    planes[i], carry = plane ^ carry, plane & carry
+
+            selected = 0
+            for count in range(len(neighbours) + 1):
+                if count in counts:
+                    match = full
+                    for i, plane in enumerate(planes):
+                        match &= plane if count >> i & 1 else ~plane
+                    selected |= match
+            result.append(selected)
+        return self._like(result)
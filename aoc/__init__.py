@@ -0,0 +1,6 @@
+"""Runner for the Advent of Code solutions of every year"""
+
+import time
+
+# CPU time used by the interpreter before importing the runner, see aoc.startup
+STARTUP_TIME = time.process_time()
@@ -0,0 +1,7 @@
+"""Run the solutions: python -m aoc run --year 2024 --day 1-10"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,144 @@
+"""Cache of solved days, keyed on the content of the input and the source code"""
+
+import ast
+import collections
+import hashlib
+import json
+import pathlib
+import typing
+
+from .discovery import ROOT, Day
+from .runner import Measurements, Result, Status
+
+RESULT_CACHE = ROOT / "result_cache.json"
+
+
+def source_files(path: pathlib.Path) -> list[pathlib.Path]:
+    """Find a module and the modules of its package it imports, recursively.
+
+    Only relative imports are followed (from .utilities import Grid, or
+    from . import utilities), as the days only share code within their package.
+
+    Returns:
+        The source files, the module itself first.
+    """
+    files = [path]
+    pending = collections.deque(files)
+    while pending:
+        file = pending.popleft()
+        for node in ast.walk(ast.parse(file.read_text(encoding="utf-8"))):
+            if not isinstance(node, ast.ImportFrom) or node.level != 1:
+                continue
+            names = (
+                [node.module] if node.module else [alias.name for alias in node.names]
+            )
+            for name in names:
+                imported = file.parent.joinpath(*name.split(".")).with_suffix(".py")
+                if imported.exists() and imported not in files:
+                    files.append(imported)
+                    pending.append(imported)
+    return files
+
+
+def source_hash(day: Day) -> str:
+    """SHA-256 of the source of a day module together with the modules it imports."""
+    digest = hashlib.sha256()
+    for path in source_files(ROOT / str(day.year) / "days" / f"{day.module}.py"):
+        digest.update(path.name.encode("utf-8") + b"\0")
+        digest.update(path.read_bytes() + b"\0")
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Answers and timings of solved days, to skip days that did not change.
+
+    An entry is keyed on the SHA-256 of the input and of the source of the day
+    module with its imports, so editing a day or its utilities, or replacing its
+    input, invalidates it. Earlier entries are kept, so switching back to an
+    earlier revision hits the cache again.
+    """
+
+    def __init__(self: "ResultCache", path: pathlib.Path) -> None:
+        """Initialize ResultCache.
+
+        Args:
+            path: JSON file containing the entries.
+        """
+        self._path = path
+        self._entries = {}
+        self._sources = {}
+        if path.exists():
+            self._entries = json.loads(path.read_text(encoding="utf-8"))
+
+    def key(self: "ResultCache", day: Day, input_hash: str) -> str:
+        """Cache key of a day and its input."""
+        if day.module not in self._sources.setdefault(day.year, {}):
+            self._sources[day.year][day.module] = source_hash(day)
+        content = f"{input_hash}:{self._sources[day.year][day.module]}"
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get(self: "ResultCache", day: Day, input_hash: str) -> typing.Optional[Result]:
+        """Look up the result of a day on an input.
+
+        Returns:
+            The cached result, with the timings of the run that solved it, None
+            when the day, its imports or the input changed since, or when the
+            entry predates storing the answers as strings.
+        """
+        entry = self._entries.get(self.key(day, input_hash))
+        if entry is None or not all(
+            isinstance(answer, str) for answer in entry["solution"]
+        ):
+            return None
+        return Result(
+            day,
+            input_hash,
+            Status.OK,
+            tuple(entry["solution"]),
+            Measurements(entry["samples"]),
+            cached=True,
+        )
+
+    def put(self: "ResultCache", results: list[Result]) -> None:
+        """Add the solved results to the cache and write it.
+
+        The answers are stored as the strings solve_day converted them to, so a
+        cached result prints and compares the same as a solved one.
+        """
+        for result in results:
+            if result.status == Status.OK and not result.cached:
+                self._entries[self.key(result.day, result.input_hash)] = {
+                    "year": result.day.year,
+                    "module": result.day.module,
+                    "solution": list(result.solution),
+                    "samples": result.measurements.samples,
+                }
+        self._path.with_suffix(".tmp").write_text(
+            json.dumps(self._entries, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        self._path.with_suffix(".tmp").replace(self._path)
+
+
+def merge_cached(
+    days: list[Day],
+    cached: dict[tuple[int, str], Result],
+    results: typing.Iterable[Result],
+) -> typing.Generator[Result, None, None]:
+    """Yield the results of all days in order, solved or taken from the cache.
+
+    Args:
+        days: all selected days.
+        cached: cached results, by year and module.
+        results: results of the days that are not cached, in order.
+
+    Raises:
+        ValueError: when there are fewer results than days that are not cached.
+    """
+    results = iter(results)
+    for day in days:
+        result = cached.get((day.year, day.module))
+        if result is None:
+            result = next(results, None)
+        if result is None:
+            raise ValueError(f"No result for {day.year} {day.module}")
+        yield result
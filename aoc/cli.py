@@ -0,0 +1,972 @@
+"""Command line interface: python -m aoc run --year 2023,2024 --day 1-10"""
+
+import argparse
+import functools
+import json
+import logging
+import pathlib
+import statistics
+import typing
+
+from .cache import RESULT_CACHE, ResultCache, merge_cached
+from .client import SOCKET_PATH
+from .discovery import Day, available_years, discover_days
+from .generators import generate_input, has_generator
+from .history import HISTORY_DB, find_trends, last_durations, store_report
+from .inputs import (
+    AOCD_DIR,
+    INPUT_STORE,
+    INPUT_URL,
+    InputStore,
+    export_inputs,
+    import_inputs,
+    load_input,
+)
+from .results import (
+    create_report,
+    find_regressions,
+    percentage,
+    to_record,
+    write_results,
+)
+from .memory import format_size
+from .microbench import BENCHMARKS, compare_days, compare_operations
+from .profiling import print_summary
+from .runner import (
+    Options,
+    PoolOptions,
+    Result,
+    Status,
+    run_pool,
+    run_sequential,
+)
+from .scaling import (
+    ScalingOptions,
+    exponent,
+    fit,
+    geometric_sizes,
+    measure,
+    write_csv,
+)
+from .startup import import_times, lazy_import, startup_times
+from .timing import PHASES, ExecutionTimer, Statistics
+from .variants import differing_answers, group_variants, speedups
+
+
+def parse_selection(text: str) -> list[int]:
+    """Parse a selection of numbers like "1-10,12" (or "2023,2024").
+
+    Returns:
+        The selected numbers, in ascending order.
+    """
+    numbers = set()
+    for part in text.split(","):
+        first, _, last = part.partition("-")
+        numbers.update(range(int(first), int(last or first) + 1))
+    return sorted(numbers)
+
+
+def format_result(result: Result) -> str:
+    """Describe the outcome of a day on a single line."""
+    summary = Statistics(result.measurements.samples["solve"])
+    timing = f"time: {summary.median:.6}s" if summary.count == 1 else str(summary)
+    phases = ", ".join(
+        f"{label}: {statistics.median(result.measurements.samples[phase]):.6}s"
+        for phase, label in {"import": "import", **PHASES}.items()
+        if phase in result.measurements.samples
+    )
+    if phases:
+        timing = f"{timing} ({phases})"
+    if result.cached:
+        timing = f"cached, {timing}"
+
+    name = f"Day {result.day.number}"
+    if result.day.variant is not None:
+        name = f"{name} ({result.day.variant})"
+    if result.status == Status.OK:
+        part1, part2 = result.solution
+        return f"{name}, part 1: {part1}, part 2: {part2}, {timing}"
+    return f"{name}, {result.status.name}, {timing}"
+
+
+def format_memory(memory: dict) -> list[str]:
+    """Describe the memory usage of the phases of a day, with the allocation sites."""
+    lines = []
+    for phase, usage in memory.items():
+        lines.append(
+            f"  memory {PHASES.get(phase, phase)}: peak {format_size(usage['peak'])}, "
+            f"retained {format_size(usage['retained'])}"
+        )
+        lines.extend(
+            f"    {format_size(size)} in {blocks} blocks: {location}"
+            for location, size, blocks in usage["sites"]
+        )
+    return lines
+
+
+def format_calls(calls: dict[str, tuple[int, float]]) -> list[str]:
+    """Describe the number of calls and the inclusive time of every hot path."""
+    return [
+        f"  calls {name}: {count}, {duration:.6}s"
+        for name, (count, duration) in calls.items()
+    ]
+
+
+def format_variants(group: list[Result]) -> list[str]:
+    """Compare the modules of a day: median time, speedup and differing answers.
+
+    The speedup is relative to the slowest module.
+    """
+    day = group[0].day
+    width = max(len(result.day.module) for result in group)
+    lines = [f"AoC {day.year} day {day.number} variants:"]
+    for result, speedup in zip(group, speedups(group)):
+        if result.status == Status.OK:
+            median = statistics.median(result.measurements.samples["solve"])
+            lines.append(
+                f"  {result.day.module:<{width}} median: {median:.6}s, "
+                f"speedup: {speedup:.2f}x"
+            )
+        else:
+            lines.append(f"  {result.day.module:<{width}} {result.status.name}")
+    reference = next(
+        (result for result in group if result.status == Status.OK), group[0]
+    )
+    lines.extend(
+        f"  {result.day.module}: answers {result.solution} differ from "
+        f"{reference.day.module}: {reference.solution}"
+        for result in differing_answers(group)
+    )
+    return lines
+
+
+def format_schedule(durations: list[float], jobs: int, wall_clock: float) -> str:
+    """Describe how well the days were spread over the workers.
+
+    The ideal wall-clock time is the total time spent on the days divided over the
+    workers, but at least the time of the longest day.
+    """
+    busy = sum(durations, 0.0)
+    ideal = max([busy / jobs, *durations])
+    idle = max(jobs * wall_clock - busy, 0.0)
+    return (
+        f"Workers: {jobs}, busy: {busy:.6}s, idle: {idle:.6}s "
+        f"({idle / (jobs * wall_clock):.1%}), wall-clock time: {wall_clock:.6}s, "
+        f"ideal: {ideal:.6}s"
+    )
+
+
+def add_run_command(commands: argparse._SubParsersAction) -> None:
+    """Add the run command, solving the puzzles, to the subcommands."""
+    run_command = commands.add_parser("run", help="solve the puzzles")
+    run_command.add_argument(
+        "-y",
+        "--year",
+        type=parse_selection,
+        help="years to solve, e.g. 2023,2024 (default: all years)",
+    )
+    run_command.add_argument(
+        "-d",
+        "--day",
+        type=parse_selection,
+        help="days to solve, e.g. 1-10,12 (default: all days)",
+    )
+    run_command.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes used to solve the days in parallel, "
+        "starting with the slowest days in the history",
+    )
+    run_command.add_argument(
+        "-t",
+        "--timeout",
+        type=float,
+        help="wall-clock limit per day in seconds",
+    )
+    run_command.add_argument(
+        "-m",
+        "--memory-limit",
+        type=int,
+        help="address space limit per day in MiB",
+    )
+    run_command.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=1,
+        help="number of timed runs per day, reporting statistics when larger than one",
+    )
+    run_command.add_argument(
+        "-w",
+        "--warmup",
+        type=int,
+        default=0,
+        help="number of untimed runs per day before the timed runs",
+    )
+    run_command.add_argument(
+        "-p",
+        "--profile",
+        nargs="?",
+        const="solve",
+        choices=["solve", *PHASES],
+        help="profile the solve step (default) or a single phase of each day, "
+        "in a run following the timed runs",
+    )
+    run_command.add_argument(
+        "--profile-dir",
+        type=pathlib.Path,
+        default=pathlib.Path("profiles"),
+        help="directory receiving the profile statistics (default: profiles)",
+    )
+    run_command.add_argument(
+        "--memory",
+        action="store_true",
+        help="report the peak and retained memory of each phase, "
+        "traced in a run following the timed runs",
+    )
+    run_command.add_argument(
+        "--isolate",
+        action="store_true",
+        help="solve every day in a fresh interpreter, so its timings do not depend "
+        "on the days solved before it",
+    )
+    run_command.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="solve all days, instead of taking the answers of days whose code "
+        "and input did not change from the result cache",
+    )
+    run_command.add_argument(
+        "--only-changed",
+        action="store_true",
+        help="only solve the days whose code or input changed since they were "
+        "last solved, leaving out the others",
+    )
+    run_command.add_argument(
+        "--variants",
+        action="store_true",
+        help="also solve the variants of every day (day_01_naive), checking that "
+        "their answers match and comparing their speed",
+    )
+    run_command.add_argument(
+        "--count-calls",
+        action="store_true",
+        help="count the calls and inclusive time of the hot paths of the utilities, "
+        "in a run following the timed runs",
+    )
+    run_command.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="number of functions listed in the profile summary, "
+        "or allocation sites per phase (default: 10)",
+    )
+    run_command.add_argument(
+        "-g",
+        "--generate",
+        type=int,
+        metavar="SIZE",
+        help="solve generated inputs of this size instead of the puzzle inputs, "
+        "skipping days without a generator",
+    )
+    run_command.add_argument(
+        "--input-url",
+        default=INPUT_URL,
+        help=f"base url to fetch missing inputs from (default: {INPUT_URL})",
+    )
+    run_command.add_argument(
+        "--connections",
+        type=int,
+        default=4,
+        help="maximum number of concurrent requests fetching inputs (default: 4)",
+    )
+    run_command.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="seed for generating the inputs (default: 0)",
+    )
+    run_command.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        help="write the results to a JSON file, or a CSV file when ending in .csv",
+    )
+    run_command.add_argument(
+        "--history",
+        nargs="?",
+        type=pathlib.Path,
+        const=HISTORY_DB,
+        metavar="PATH",
+        help="append the results to a SQLite history (default: history.sqlite)",
+    )
+    run_command.add_argument(
+        "-c",
+        "--compare",
+        type=pathlib.Path,
+        help="JSON results of an earlier run, fail when a day got slower",
+    )
+    run_command.add_argument(
+        "--threshold",
+        type=percentage,
+        default="10%",
+        help="allowed slowdown compared to the baseline (default: 10%%)",
+    )
+
+
+def add_scaling_command(commands: argparse._SubParsersAction) -> None:
+    """Add the scaling command to the subcommands."""
+    scaling_command = commands.add_parser(
+        "scaling", help="fit the growth of the execution time on generated inputs"
+    )
+    scaling_command.add_argument(
+        "-y", "--year", type=int, required=True, help="year of the puzzle"
+    )
+    scaling_command.add_argument(
+        "-d", "--day", type=int, required=True, help="day of the puzzle"
+    )
+    scaling_command.add_argument(
+        "-p",
+        "--phase",
+        choices=["solve", *PHASES],
+        default="solve",
+        help="timed phase (default: solve)",
+    )
+    scaling_command.add_argument(
+        "--start", type=int, default=10, help="smallest input size (default: 10)"
+    )
+    scaling_command.add_argument(
+        "--stop", type=int, default=1000, help="largest input size (default: 1000)"
+    )
+    scaling_command.add_argument(
+        "--steps",
+        type=int,
+        default=7,
+        help="number of sizes, growing geometrically (default: 7)",
+    )
+    scaling_command.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=3,
+        help="number of timed runs per size (default: 3)",
+    )
+    scaling_command.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="seed for generating the inputs (default: 0)",
+    )
+    scaling_command.add_argument(
+        "--limit",
+        type=float,
+        default=10.0,
+        help="skip the larger sizes once a size takes longer, in seconds (default: 10)",
+    )
+    scaling_command.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        help="write the measurements and fitted times to a CSV file",
+    )
+
+
+def add_history_command(commands: argparse._SubParsersAction) -> None:
+    """Add the history command to the subcommands."""
+    history_command = commands.add_parser(
+        "history", help="show the timing trends of the days from the history"
+    )
+    history_command.add_argument(
+        "-y",
+        "--year",
+        type=parse_selection,
+        help="years to show, e.g. 2023,2024 (default: all years)",
+    )
+    history_command.add_argument(
+        "-d",
+        "--day",
+        type=parse_selection,
+        help="days to show, e.g. 1-10,12 (default: all days)",
+    )
+    history_command.add_argument(
+        "--phase",
+        choices=["solve", *PHASES],
+        default="solve",
+        help="compared phase (default: solve)",
+    )
+    history_command.add_argument(
+        "--threshold",
+        type=percentage,
+        default="10%",
+        help="slowdown compared to the fastest run counting as a regression "
+        "(default: 10%%)",
+    )
+    history_command.add_argument(
+        "-p",
+        "--path",
+        type=pathlib.Path,
+        default=HISTORY_DB,
+        help="SQLite history (default: history.sqlite)",
+    )
+
+
+def add_input_commands(commands: argparse._SubParsersAction) -> None:
+    """Add the commands importing, exporting and serving inputs to the subcommands."""
+    import_command = commands.add_parser(
+        "import-inputs", help="import inputs into the local input store"
+    )
+    import_command.add_argument(
+        "-p",
+        "--path",
+        type=pathlib.Path,
+        default=AOCD_DIR,
+        help="directory to import the inputs from (default: the aocd cache)",
+    )
+
+    export_command = commands.add_parser(
+        "export-inputs", help="export the inputs from the local input store"
+    )
+    export_command.add_argument(
+        "-p",
+        "--path",
+        type=pathlib.Path,
+        required=True,
+        help="directory to export the inputs to",
+    )
+
+    serve_command = commands.add_parser(
+        "serve-inputs",
+        help="serve inputs locally like the puzzle input endpoint, for --input-url",
+    )
+    serve_command.add_argument(
+        "-p",
+        "--path",
+        type=pathlib.Path,
+        required=True,
+        help="directory with the inputs to serve, as written by export-inputs",
+    )
+    serve_command.add_argument(
+        "--port", type=int, default=8000, help="port to listen on (default: 8000)"
+    )
+    serve_command.add_argument(
+        "--delay",
+        type=float,
+        default=0.0,
+        help="seconds to wait before every response (default: 0)",
+    )
+    serve_command.add_argument(
+        "--fail-rate",
+        type=percentage,
+        default="0%",
+        help="share of the requests failing with 503, to exercise retries "
+        "(default: 0%%)",
+    )
+
+
+def add_microbench_command(commands: argparse._SubParsersAction) -> None:
+    """Add the microbench command to the subcommands."""
+    microbench_command = commands.add_parser(
+        "microbench",
+        help="compare a utility with its earlier implementation, on basic operations "
+        "and on the days depending on it",
+    )
+    microbench_command.add_argument(
+        "name", choices=sorted(BENCHMARKS), help="the compared utility"
+    )
+    microbench_command.add_argument(
+        "-y",
+        "--year",
+        type=int,
+        default=2024,
+        help="year of the utilities timed on basic operations (default: 2024)",
+    )
+    microbench_command.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=3,
+        help="number of timed runs per day (default: 3)",
+    )
+    microbench_command.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="seed for generating the inputs of the days (default: 0)",
+    )
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the parser for the command line arguments."""
+    parser = argparse.ArgumentParser(prog="aoc", description="Advent of Code")
+    commands = parser.add_subparsers(dest="command", required=True)
+    add_run_command(commands)
+    add_scaling_command(commands)
+    add_history_command(commands)
+    add_input_commands(commands)
+    add_microbench_command(commands)
+
+    daemon_command = commands.add_parser(
+        "daemon",
+        help="keep the runner, day modules and inputs in memory, solving the days "
+        "requested with python -m aoc.client",
+    )
+    daemon_command.add_argument(
+        "--socket",
+        type=pathlib.Path,
+        default=SOCKET_PATH,
+        help=f"Unix socket to listen on (default: {SOCKET_PATH})",
+    )
+    return parser
+
+
+def select_days(parser: argparse.ArgumentParser, args: argparse.Namespace) -> list[Day]:
+    """Find the modules of the selected years and days, with their variants if asked."""
+    years = available_years()
+    if args.year is not None:
+        unknown = set(args.year) - set(years)
+        if unknown:
+            parser.error(f"no solutions for {', '.join(map(str, sorted(unknown)))}")
+        years = args.year
+    return discover_days(
+        years, None if args.day is None else set(args.day), args.variants
+    )
+
+
+def is_benchmark(args: argparse.Namespace) -> bool:
+    """Whether the run measures the days, so cached results can not stand in."""
+    return (
+        args.repeat > 1
+        or args.warmup > 0
+        or args.profile is not None
+        or args.memory
+        or args.count_calls
+        or args.history is not None
+        or args.compare is not None
+    )
+
+
+def select_stored_inputs(
+    parser: argparse.ArgumentParser,
+    args: argparse.Namespace,
+    days: list[Day],
+    cache: ResultCache,
+) -> tuple[list[Day], dict[tuple[int, str], Result], typing.Callable]:
+    """Take the days whose code and input did not change from the result cache.
+
+    Missing inputs of the other days are prefetched in the background.
+
+    Returns:
+        The days to report (without the unchanged days with --only-changed), the
+        cached results by year and module, and the function loading an input.
+    """
+    if args.connections < 1:
+        parser.error("--connections must be at least 1")
+    store = InputStore(INPUT_STORE)
+    cached = {}
+    if args.only_changed or not (args.no_cache or is_benchmark(args)):
+        for day in days:
+            digest = store.digest(day.year, day.number)
+            result = None if digest is None else cache.get(day, digest)
+            if result is not None:
+                cached[day.year, day.module] = result
+    if args.only_changed:
+        days = [day for day in days if (day.year, day.module) not in cached]
+        cached = {}
+
+    unsolved = [day for day in days if (day.year, day.module) not in cached]
+    load = functools.partial(load_input, store)
+    if any(store.digest(day.year, day.number) is None for day in unsolved):
+        prefetch = lazy_import("aoc.prefetch")
+        prefetcher = prefetch.Prefetcher(
+            store,
+            [(day.year, day.number) for day in unsolved],
+            prefetch.FetchOptions(args.input_url, args.connections),
+        )
+        prefetcher.start()
+        load = prefetcher.load
+    return days, cached, load
+
+
+def select_generated_inputs(
+    parser: argparse.ArgumentParser, args: argparse.Namespace, days: list[Day]
+) -> tuple[list[Day], typing.Callable]:
+    """Leave out the days without an input generator.
+
+    Returns:
+        The days with a generator and the function generating an input.
+    """
+    if args.generate < 1:
+        parser.error("--generate must be at least 1")
+    if args.only_changed:
+        parser.error("--only-changed can not be combined with --generate")
+    for day in days:
+        if not has_generator(day.year, day.number):
+            logging.warning("%d day %d: no input generator", day.year, day.number)
+    days = [day for day in days if has_generator(day.year, day.number)]
+    load = functools.partial(generate_input, size=args.generate, seed=args.seed)
+    return days, load
+
+
+def is_pooled(args: argparse.Namespace) -> bool:
+    """Whether the days are solved in worker processes rather than in this one."""
+    return (
+        args.jobs > 1
+        or args.timeout is not None
+        or bool(args.memory_limit)
+        or args.isolate
+    )
+
+
+def solve_days(
+    args: argparse.Namespace,
+    options: Options,
+    load: typing.Callable,
+    days: list[Day],
+) -> typing.Iterable[Result]:
+    """Solve the days in this process, or in a pool when limiting or spreading them.
+
+    Returns:
+        The results, in the order of the days, as they become available.
+    """
+    if not is_pooled(args):
+        return run_sequential(load, days, options)
+
+    memory_limit = args.memory_limit * 2**20 if args.memory_limit else None
+    history_path = args.history or HISTORY_DB
+    durations = last_durations(history_path) if history_path.exists() else None
+    return run_pool(
+        load,
+        days,
+        options,
+        PoolOptions(args.jobs, args.timeout, memory_limit, durations, args.isolate),
+    )
+
+
+def print_results(
+    args: argparse.Namespace,
+    options: Options,
+    results: typing.Iterable[Result],
+    report: dict,
+) -> list[Result]:
+    """Print every result as it becomes available, adding it to the report.
+
+    Returns:
+        The results.
+    """
+    years = set()
+    solved = []
+    for result in results:
+        if result.day.year not in years:
+            years.add(result.day.year)
+            print(f"AoC {result.day.year}")
+        report["results"].append(to_record(result))
+        solved.append(result)
+        print(format_result(result))
+        if args.profile is not None and result.status == Status.OK:
+            print_summary(options.profile_path(result.day), args.top)
+        if result.measurements.memory is not None:
+            print("\n".join(format_memory(result.measurements.memory)))
+        if result.measurements.calls:
+            print("\n".join(format_calls(result.measurements.calls)))
+    return solved
+
+
+def print_totals(
+    args: argparse.Namespace, solved: list[Result], wall_clock: float
+) -> None:
+    """Print the execution time per year and in total, and the use of the workers."""
+    execution_times = {}
+    for result in solved:
+        # Variants solve the same puzzle again, so only count the canonical module,
+        # and cached results and days without an input were not solved in this run
+        times = execution_times.setdefault(result.day.year, [])
+        if (
+            result.day.variant is None
+            and not result.cached
+            and result.status != Status.NO_INPUT
+        ):
+            times.append(statistics.median(result.measurements.samples["solve"]))
+
+    for year, times in execution_times.items():
+        if len(times) < 2:
+            continue
+        print(
+            f"AoC {year} execution time: {sum(times):.6}s, min: {min(times):.6}s, max: {max(times):.6}s"
+        )
+    total = [duration for times in execution_times.values() for duration in times]
+    if len(total) > 1:
+        print(
+            f"Total execution time: {sum(total):.6}s, wall-clock time: {wall_clock:.6}s"
+        )
+    busy = [
+        result.measurements.duration
+        for result in solved
+        if result.measurements.duration is not None
+    ]
+    if is_pooled(args) and args.jobs > 1 and len(busy) > 1:
+        print(format_schedule(busy, args.jobs, wall_clock))
+
+
+def print_startup(startup: dict[str, float], report: dict) -> None:
+    """Print the startup costs, adding them to the report."""
+    report["startup"] = {**startup, "imports": import_times}
+    imports = ", ".join(
+        f"{name} import: {duration:.6}s" for name, duration in import_times.items()
+    )
+    print(
+        f"Startup time: interpreter: {startup['interpreter']:.6}s, "
+        f"runner imports: {startup['runner imports']:.6}s (CPU time)"
+        + (f", {imports}" if imports else "")
+    )
+
+
+def store_and_compare(args: argparse.Namespace, report: dict) -> int:
+    """Write the report to the output and the history, and compare it to the baseline.
+
+    Returns:
+        The exit code, non-zero when a day got slower than the baseline.
+    """
+    if args.output is not None:
+        write_results(args.output, report)
+    if args.history is not None:
+        store_report(args.history, report)
+    if args.compare is None:
+        return 0
+
+    baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+    regressions = find_regressions(report, baseline, args.threshold)
+    for year, day, old, new in regressions:
+        print(f"Regression {year} {day}: {old:.6}s -> {new:.6}s ({new / old - 1:+.1%})")
+    if regressions:
+        return 1
+    print(f"No regressions compared to {args.compare}")
+    return 0
+
+
+def run(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    """Solve the selected days and report the results.
+
+    Returns:
+        The exit code, non-zero when a day got slower than the baseline or when
+        the variants of a day answered differently.
+    """
+    startup = startup_times()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.repeat < 1 or args.warmup < 0:
+        parser.error("--repeat must be at least 1 and --warmup can not be negative")
+
+    days = select_days(parser, args)
+    cache = None
+    cached = {}
+    if args.generate is None:
+        cache = ResultCache(RESULT_CACHE)
+        days, cached, load = select_stored_inputs(parser, args, days, cache)
+    else:
+        days, load = select_generated_inputs(parser, args, days)
+
+    options = Options(
+        args.repeat,
+        args.warmup,
+        args.profile,
+        args.profile_dir,
+        args.memory,
+        args.top,
+        args.count_calls,
+    )
+    unsolved = [day for day in days if (day.year, day.module) not in cached]
+    results = merge_cached(days, cached, solve_days(args, options, load, unsolved))
+
+    report = create_report(args.repeat, args.warmup)
+    with ExecutionTimer() as wall_clock:
+        solved = print_results(args, options, results, report)
+    print_totals(args, solved, wall_clock.duration)
+    print_startup(startup, report)
+
+    if cache is not None:
+        cache.put(solved)
+
+    exit_code = 0
+    for group in group_variants(solved):
+        print("\n".join(format_variants(group)))
+        if differing_answers(group):
+            exit_code = 1
+    return store_and_compare(args, report) or exit_code
+
+
+def scaling(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    """Time a day on growing generated inputs and report the best fitting complexity.
+
+    Returns:
+        The exit code.
+    """
+    if not 1 <= args.start <= args.stop or args.steps < 1 or args.repeat < 1:
+        parser.error(
+            "--start must be positive and at most --stop, --steps and --repeat at least 1"
+        )
+    if not has_generator(args.year, args.day):
+        parser.error(f"no input generator for {args.year} day {args.day}")
+    days = discover_days([args.year], {args.day})
+    if not days:
+        parser.error(f"no solution for {args.year} day {args.day}")
+
+    day = days[0]
+    sizes = geometric_sizes(args.start, args.stop, args.steps)
+    label = PHASES.get(args.phase, args.phase)
+    print(f"AoC {day.year} day {day.number} ({day.module}), {label}, seed {args.seed}")
+    measurements = measure(
+        day, sizes, ScalingOptions(args.phase, args.seed, args.repeat, args.limit)
+    )
+
+    print(f"{'size':>10} {'median':>12} {'growth':>8}")
+    previous = None
+    for size, summary in measurements:
+        growth = "" if previous is None else f"{summary.median / previous:.3g}x"
+        print(f"{size:>10} {summary.median:>11.6}s {growth:>8}")
+        previous = summary.median
+
+    sizes = [size for size, _ in measurements]
+    times = [summary.median for _, summary in measurements]
+    fits = fit(sizes, times)
+    slope = exponent(sizes, times)
+    if fits and slope is not None:
+        print(f"Best fit: {fits[0][0]}, log-log slope: {slope:.3}")
+        for name, _, _, error in fits:
+            print(f"  {name:<13} relative error: {error:.1%}")
+    else:
+        print("Not enough sizes to fit the growth")
+
+    if args.output is not None:
+        write_csv(args.output, measurements, fits)
+    return 0
+
+
+def history(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    """Show the fastest and latest timing of every day in the history.
+
+    Returns:
+        The exit code, non-zero when a day has an ongoing regression.
+    """
+    if not args.path.exists():
+        parser.error(f"no history at {args.path}, use run --history first")
+
+    trends = find_trends(args.path, args.year, args.day, args.phase, args.threshold)
+    year = None
+    for trend in trends:
+        if trend.year != year:
+            year = trend.year
+            print(f"AoC {year}")
+        median, revision, started = trend.fastest
+        line = f"{trend.module}: fastest {median:.6}s ({revision}, {started})"
+        median, revision, started, status = trend.latest
+        latest = f"{median:.6}s" if status == Status.OK.name else status
+        line += f", latest {latest} ({revision}, {started}), {trend.change:+.1%}"
+        if trend.regression is not None:
+            line += f", regression since {trend.regression[0]} ({trend.regression[1]})"
+        print(line)
+    return 1 if any(trend.regression is not None for trend in trends) else 0
+
+
+def microbench(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    """Compare a utility with its earlier implementation and print the speedups.
+
+    Returns:
+        The exit code.
+    """
+    if args.year not in available_years():
+        parser.error(f"no solutions for {args.year}")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    microbenchmark = BENCHMARKS[args.name]
+
+    print(f"{microbenchmark.name} of {args.year}, time per operation on 10000 items")
+    print(f"{'operation':<24} {'legacy':>12} {'current':>12} {'speedup':>8}")
+    for operation, legacy, current in compare_operations(microbenchmark, args.year):
+        print(
+            f"{operation:<24} {legacy:>11.6}s {current:>11.6}s {legacy / current:>7.2f}x"
+        )
+
+    print(f"{'day':<24} {'legacy':>12} {'current':>12} {'speedup':>8}")
+    for day, size, legacy, current in compare_days(
+        microbenchmark, args.seed, args.repeat
+    ):
+        label = f"{day.year} day {day.number} (size {size})"
+        print(f"{label:<24} {legacy:>11.6}s {current:>11.6}s {legacy / current:>7.2f}x")
+    return 0
+
+
+def main(argv: typing.Optional[list[str]] = None) -> int:
+    """Entry point of the command line interface.
+
+    Args:
+        argv: command line arguments, sys.argv when None.
+
+    Returns:
+        The exit code.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(filename)s:%(lineno)s - %(levelname)s: %(message)s",
+        datefmt="%Y.%m.%d %H:%M:%S",
+    )
+
+    parser = create_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "import-inputs":
+        import_inputs(InputStore(INPUT_STORE), args.path)
+    elif args.command == "export-inputs":
+        export_inputs(InputStore(INPUT_STORE), args.path)
+    elif args.command == "daemon":
+        try:
+            lazy_import("aoc.daemon").serve(args.socket)
+        except RuntimeError as error:
+            parser.error(str(error))
+    elif args.command == "serve-inputs":
+        lazy_import("aoc.inputserver").serve_inputs(
+            args.path, args.port, args.delay, args.fail_rate
+        )
+    else:
+        commands = {
+            "run": run,
+            "scaling": scaling,
+            "history": history,
+            "microbench": microbench,
+        }
+        return commands[args.command](parser, args)
+    return 0
+
+
+def subcommands(parser: argparse.ArgumentParser) -> dict[str, argparse.ArgumentParser]:
+    """The parsers of the subcommands of a parser, by name."""
+    # argparse has no public access to the subparsers of a parser
+    # pylint: disable=protected-access
+    return next(
+        action.choices
+        for action in parser._actions
+        if isinstance(action, argparse._SubParsersAction)
+    )
+
+
+def main_for_year(year: int, argv: list[str]) -> int:
+    """Entry point of the run.py script of a year.
+
+    Arguments not starting with a subcommand are passed to the run command, and
+    the year is added to the subcommands accepting --year.
+
+    Args:
+        year: year of the script.
+        argv: command line arguments of the script.
+
+    Returns:
+        The exit code.
+    """
+    commands = subcommands(create_parser())
+    if not argv or argv[0] not in commands:
+        argv = ["run", *argv]
+    # pylint: disable-next=protected-access
+    if "--year" in commands[argv[0]]._option_string_actions:
+        argv = [*argv, "--year", str(year)]
+    return main(argv)
@@ -0,0 +1,122 @@
+"""Thin client of the solver daemon: python -m aoc.client -y 2024 -d 5 --reload
+
+Only the standard library is imported, so the client starts in a few milliseconds
+while the daemon keeps the runner, the day modules and the inputs in memory.
+"""
+
+import argparse
+import json
+import os
+import pathlib
+import socket
+import sys
+import tempfile
+import time
+import typing
+
+SOCKET_PATH = pathlib.Path(tempfile.gettempdir()) / f"aoc-{os.getuid()}.sock"
+
+
+def request(path: pathlib.Path, message: dict) -> dict:
+    """Send a single request to the daemon and wait for its response.
+
+    Args:
+        path: Unix socket of the daemon.
+        message: the request, see aoc.daemon.SolverDaemon.handle.
+
+    Returns:
+        The response of the daemon.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(path))
+        connection.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        with connection.makefile("rb") as response:
+            return json.loads(response.readline())
+
+
+def main(argv: typing.Optional[list[str]] = None) -> int:
+    """Ask the daemon to solve a day and print the outcome.
+
+    Args:
+        argv: command line arguments, sys.argv when None.
+
+    Returns:
+        The exit code, non-zero when the daemon is not running or failed.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-y", "--year", type=int, required=True, help="year")
+    parser.add_argument("-d", "--day", type=int, required=True, help="day")
+    parser.add_argument(
+        "--reload",
+        action="store_true",
+        help="import the day modules and utilities of the year again, after editing",
+    )
+    parser.add_argument(
+        "--variants",
+        action="store_true",
+        help="also solve the variants of the day, comparing answers and speed",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=1,
+        help="number of timed runs per day (default: 1)",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=0,
+        help="number of untimed runs before the timed runs (default: 0)",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="trace the memory allocations in an additional run",
+    )
+    parser.add_argument(
+        "--count-calls",
+        action="store_true",
+        help="count the calls of the hot paths in an additional run",
+    )
+    parser.add_argument(
+        "--socket",
+        type=pathlib.Path,
+        default=SOCKET_PATH,
+        help=f"Unix socket of the daemon (default: {SOCKET_PATH})",
+    )
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        response = request(
+            args.socket,
+            {
+                "year": args.year,
+                "day": args.day,
+                "reload": args.reload,
+                "variants": args.variants,
+                "repeat": args.repeat,
+                "warmup": args.warmup,
+                "memory": args.memory,
+                "count_calls": args.count_calls,
+            },
+        )
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(
+            f"No daemon listening on {args.socket}, start it with: python -m aoc daemon",
+            file=sys.stderr,
+        )
+        return 2
+    duration = time.perf_counter() - start
+
+    if "error" in response:
+        print(response["error"], file=sys.stderr)
+        return 1
+    print("\n".join(response["lines"]))
+    print(f"Round trip: {duration:.6}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
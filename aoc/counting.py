@@ -0,0 +1,145 @@
+"""Call counts and inclusive time of the hot paths registered in the utilities of a year"""
+
+import contextlib
+import functools
+import inspect
+import logging
+import sys
+import time
+import types
+import typing
+
+from .timing import reset_caches, run_once
+
+
+class CallCounter:
+    """Number of calls and inclusive time of a single function.
+
+    Attributes:
+        calls (int): number of calls.
+        duration_ns (int): time spent inside the function in nanoseconds, only
+            counting the outermost call of a recursion. For a generator, the
+            time spent producing its values.
+    """
+
+    def __init__(self: "CallCounter") -> None:
+        """Initialize CallCounter."""
+        self.calls = 0
+        self.duration_ns = 0
+        self._depth = 0
+
+    @property
+    def duration(self: "CallCounter") -> float:
+        """Inclusive time in seconds."""
+        return self.duration_ns / 1e9
+
+    def wrap(self: "CallCounter", function: typing.Callable) -> typing.Callable:
+        """Wrap a function (or generator function) to count its calls."""
+        if inspect.isgeneratorfunction(function):
+
+            @functools.wraps(function)
+            def generator(*args, **kwargs):
+                self.calls += 1
+                iterator = function(*args, **kwargs)
+                while True:
+                    start = time.perf_counter_ns()
+                    try:
+                        value = next(iterator)
+                    except StopIteration:
+                        return
+                    finally:
+                        self.duration_ns += time.perf_counter_ns() - start
+                    yield value
+
+            return generator
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            self.calls += 1
+            self._depth += 1
+            start = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.duration_ns += time.perf_counter_ns() - start
+
+        return wrapper
+
+
+@contextlib.contextmanager
+def counting(
+    functions: list[typing.Callable],
+) -> typing.Generator[dict[str, CallCounter], None, None]:
+    """Replace functions by counting wrappers, restoring them afterwards.
+
+    Methods are replaced on their class. Functions are replaced in every module
+    of their package that imported them, as the days use `from .utilities import`.
+
+    Args:
+        functions: functions to count, as registered with the hot_path decorator.
+
+    Yields:
+        The counter per function, by qualified name.
+    """
+    counters = {}
+    replaced = []
+    try:
+        for function in functions:
+            if "<locals>" in function.__qualname__:
+                logging.warning("Can not count %s", function.__qualname__)
+                continue
+            counter = counters.setdefault(function.__qualname__, CallCounter())
+            wrapper = counter.wrap(function)
+
+            *path, name = function.__qualname__.split(".")
+            owners = [sys.modules[function.__module__]]
+            for part in path:
+                owners = [getattr(owners[0], part)]
+            if not path:
+                package = function.__module__.rpartition(".")[0]
+                owners += [
+                    module
+                    for module_name, module in list(sys.modules.items())
+                    if module_name.startswith(f"{package}.")
+                    and module is not owners[0]
+                    and getattr(module, name, None) is function
+                ]
+
+            for owner in owners:
+                replaced.append((owner, name, function))
+                setattr(owner, name, wrapper)
+        yield counters
+    finally:
+        for owner, name, function in reversed(replaced):
+            setattr(owner, name, function)
+
+
+def count_calls(module: types.ModuleType, data: str) -> dict[str, tuple[int, float]]:
+    """Solve a day once while counting the calls of the hot paths of its year.
+
+    The hot paths are the functions registered in HOT_PATHS of the utilities
+    module next to the day module. The hot_path decorator registering them
+    returns the function unchanged, so they cost nothing outside this run.
+
+    Args:
+        module: day module.
+        data: puzzle input.
+
+    Returns:
+        The number of calls and the inclusive time in seconds per called hot path,
+        by qualified name, the slowest first.
+    """
+    utilities = sys.modules.get(f"{module.__package__}.utilities")
+    functions = getattr(utilities, "HOT_PATHS", [])
+    reset_caches(module)
+    with counting(functions) as counters:
+        run_once(module, data, lambda phase: contextlib.nullcontext())
+    return {
+        name: (counter.calls, counter.duration)
+        for name, counter in sorted(
+            counters.items(), key=lambda item: item[1].duration_ns, reverse=True
+        )
+        if counter.calls
+    }
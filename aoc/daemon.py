@@ -0,0 +1,139 @@
+"""Resident solver: keeps the interpreter, the day modules and the inputs warm"""
+
+import importlib
+import json
+import logging
+import pathlib
+import signal
+import socket
+import socketserver
+import sys
+import traceback
+
+from .cli import format_calls, format_memory, format_result, format_variants
+from .discovery import available_years, discover_days
+from .inputs import INPUT_STORE, InputStore, load_input
+from .results import to_record
+from .runner import Options, Result, solve_day
+from .variants import group_variants
+
+
+class SolverDaemon:
+    """Solve days on request, reusing the imported modules and the loaded inputs.
+
+    The days are solved one at a time in the daemon process, so the timings of
+    concurrent requests do not disturb each other.
+    """
+
+    def __init__(self: "SolverDaemon", store: InputStore) -> None:
+        """Initialize SolverDaemon."""
+        self._store = store
+        self._inputs = {}
+
+    def handle(self: "SolverDaemon", message: dict) -> dict:
+        """Solve the modules of a day.
+
+        Args:
+            message: the request, with the year and day, whether to reload the
+                modules of the year ("reload"), whether to solve the variants of
+                the day ("variants"), and the optional run settings "repeat",
+                "warmup", "memory" and "count_calls".
+
+        Returns:
+            The response: the formatted output ("lines") and the report entry of
+            every module of the day ("results"), or an "error" description.
+        """
+        year, number = message["year"], message["day"]
+        if year not in available_years():
+            return {"error": f"No solutions for {year}"}
+        if message.get("reload", False):
+            reload_year(year)
+        days = discover_days([year], {number}, message.get("variants", False))
+        if not days:
+            return {"error": f"No solution for {year} day {number}"}
+
+        if (year, number) not in self._inputs:
+            self._inputs[year, number] = load_input(self._store, year, number)
+        data, digest = self._inputs[year, number]
+
+        options = Options(
+            message.get("repeat", 1),
+            message.get("warmup", 0),
+            memory=message.get("memory", False),
+            count_calls=message.get("count_calls", False),
+        )
+        lines = []
+        results = []
+        for day in days:
+            result = Result(day, digest, *solve_day(day, data, options))
+            lines.append(format_result(result))
+            if result.measurements.memory is not None:
+                lines.extend(format_memory(result.measurements.memory))
+            if result.measurements.calls:
+                lines.extend(format_calls(result.measurements.calls))
+            results.append(result)
+        for group in group_variants(results):
+            lines.extend(format_variants(group))
+        return {"lines": lines, "results": [to_record(result) for result in results]}
+
+
+def reload_year(year: int) -> None:
+    """Forget the imported modules of a year, so the next solve imports them again.
+
+    Removing the day modules together with the utilities, rather than reloading
+    them one by one, avoids days holding on to classes of an older utilities module.
+    The import system caches the directory listings, those caches are invalidated
+    as well, so modules added since (like a new variant) are discovered.
+    """
+    importlib.invalidate_caches()
+    prefix = f"days_{year}."
+    for name in [name for name in sys.modules if name.startswith(prefix)]:
+        del sys.modules[name]
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Read a single JSON request line and answer with a single JSON line."""
+
+    solver = None
+
+    def handle(self: "RequestHandler") -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            message = json.loads(line)
+            logging.info("Request: %s", message)
+            response = self.solver.handle(message)
+        except Exception:  # pylint: disable=broad-exception-caught
+            response = {"error": traceback.format_exc()}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+def serve(path: pathlib.Path) -> None:
+    """Answer solve requests on a Unix socket until interrupted or terminated.
+
+    Args:
+        path: Unix socket to listen on, replaced when left behind by a daemon
+            that is no longer running.
+
+    Raises:
+        RuntimeError: when another daemon is listening on the socket.
+    """
+    if path.exists():
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            if probe.connect_ex(str(path)) == 0:
+                raise RuntimeError(f"A daemon is already listening on {path}")
+        path.unlink()
+
+    handler = type(
+        "Handler", (RequestHandler,), {"solver": SolverDaemon(InputStore(INPUT_STORE))}
+    )
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        with socketserver.UnixStreamServer(str(path), handler) as server:
+            logging.info("Listening on %s", path)
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        path.unlink(missing_ok=True)
@@ -0,0 +1,116 @@
+"""Discovery and loading of the day modules of every year"""
+
+import importlib
+import importlib.util
+import logging
+import pathlib
+import pkgutil
+import re
+import sys
+import types
+import typing
+
+ROOT = pathlib.Path(__file__).parent.parent.resolve()
+
+
+class Day:
+    """A single day module of a specific year.
+
+    Besides the canonical module (day_01), a day can have variants: alternative
+    implementations named after the canonical module with a suffix, like
+    day_01_naive or day_01_numpy.
+
+    Attributes:
+        year (int): year of the puzzle.
+        number (int): day of the puzzle.
+        module (str): name of the module within the days package of the year.
+        variant (str): suffix of a variant module ("naive"), None for the
+            canonical module.
+    """
+
+    def __init__(
+        self: "Day",
+        year: int,
+        number: int,
+        module: str,
+        variant: typing.Optional[str] = None,
+    ) -> None:
+        """Initialize Day."""
+        self.year = year
+        self.number = number
+        self.module = module
+        self.variant = variant
+
+    def __repr__(self: "Day") -> str:
+        return f"<Day year: {self.year}, number: {self.number}, module: {self.module}>"
+
+    def __lt__(self: "Day", other: "Day") -> bool:
+        return (self.year, self.number, self.module) < (
+            other.year,
+            other.number,
+            other.module,
+        )
+
+
+def available_years() -> list[int]:
+    """Find all years with a days package, e.g. 2024/days."""
+    return sorted(
+        int(path.parent.parent.name)
+        for path in ROOT.glob("[0-9][0-9][0-9][0-9]/days/__init__.py")
+    )
+
+
+def discover_days(
+    years: list[int],
+    numbers: typing.Optional[set[int]] = None,
+    variants: bool = False,
+) -> list[Day]:
+    """Find the day modules of the given years, ordered by year and day.
+
+    Args:
+        years: years to search.
+        numbers: only include these days, None for all days.
+        variants: include the variant modules, following the canonical module of
+            their day.
+
+    Returns:
+        The day modules.
+    """
+    days = []
+    for year in years:
+        path = ROOT / str(year) / "days"
+        modules = [name for _, name, _ in pkgutil.iter_modules([str(path)])]
+        logging.debug("Found the following modules for %d: %s", year, modules)
+
+        for module in modules:
+            match = re.fullmatch(r"day_(\d+)(?:_(\w+))?", module)
+            if match is None or (match.group(2) is not None and not variants):
+                continue
+            number = int(match.group(1))
+            if numbers is None or number in numbers:
+                days.append(Day(year, number, module, match.group(2)))
+    return sorted(days)
+
+
+def load_module(year: int, module: str) -> types.ModuleType:
+    """Import a day module of a specific year.
+
+    Every year has its own days package, so each one is registered under a
+    unique name (days_2024) to load the modules of several years side by side.
+
+    Args:
+        year: year of the puzzle.
+        module: name of the module within the days package.
+
+    Returns:
+        The imported module.
+    """
+    package = f"days_{year}"
+    if package not in sys.modules:
+        path = ROOT / str(year) / "days"
+        spec = importlib.util.spec_from_file_location(
+            package, path / "__init__.py", submodule_search_locations=[str(path)]
+        )
+        sys.modules[package] = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(sys.modules[package])
+    return importlib.import_module(f"{package}.{module}")
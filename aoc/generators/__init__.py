@@ -0,0 +1,29 @@
+"""Synthetic puzzle inputs of a chosen size, to stress the solutions beyond the real inputs"""
+
+import hashlib
+import random
+
+from . import year_2023, year_2024
+
+GENERATORS = {2023: year_2023.GENERATORS, 2024: year_2024.GENERATORS}
+
+
+def has_generator(year: int, day: int) -> bool:
+    """Whether inputs can be generated for a day."""
+    return day in GENERATORS.get(year, {})
+
+
+def generate_input(year: int, day: int, size: int, seed: int = 0) -> tuple[str, str]:
+    """Generate the input of a day, the same size and seed giving the same input.
+
+    Args:
+        year: year of the puzzle.
+        day: day of the puzzle.
+        size: size of the input, its meaning depends on the day.
+        seed: seed of the random number generator.
+
+    Returns:
+        The input and its SHA-256.
+    """
+    data = GENERATORS[year][day](size, random.Random(seed))
+    return data, hashlib.sha256(data.encode("utf-8")).hexdigest()
@@ -0,0 +1,27 @@
+"""Input generators for the puzzles of 2023, see year_2024 for the conventions"""
+
+import math
+import random
+
+
+def day_11(size: int, rng: random.Random) -> str:
+    """Image with size galaxies, about one in 50 positions, leaving rows and columns empty."""
+    side = max(2, math.isqrt(50 * size))
+    empty_rows = set(rng.sample(range(side), side // 10))
+    empty_columns = set(rng.sample(range(side), side // 10))
+    positions = [
+        (x, y)
+        for y in range(side)
+        for x in range(side)
+        if y not in empty_rows and x not in empty_columns
+    ]
+    galaxies = set(rng.sample(positions, min(size, len(positions))))
+    return "\n".join(
+        "".join("#" if (x, y) in galaxies else "." for x in range(side))
+        for y in range(side)
+    )
+
+
+GENERATORS = {
+    11: day_11,
+}
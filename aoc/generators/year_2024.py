@@ -0,0 +1,562 @@
+"""Input generators for the puzzles of 2024
+
+Every generator takes a size and a random number generator and returns a valid
+puzzle input. The meaning of the size depends on the day, it is the dimension
+that grows in the real inputs: the number of lines, the side of a grid, the
+number of digits, etc.
+"""
+
+import collections
+import fractions
+import itertools
+import random
+import string
+
+
+def _lines(rows: list) -> str:
+    """Join the rows of a grid, or any other lines, into an input."""
+    return "\n".join("".join(row) for row in rows)
+
+
+def _maze(size: int, rng: random.Random) -> list[list[str]]:
+    """Carve a perfect maze, exactly one path between any two open cells.
+
+    The maze has an odd side of at least 5, with walls on the border and the
+    open cells on the odd positions, starting from the bottom left corner.
+    """
+    side = max(5, size | 1)
+    cells = [["#"] * side for _ in range(side)]
+    start = (1, side - 2)
+    cells[start[1]][start[0]] = "."
+    stack = [start]
+    while stack:
+        x, y = stack[-1]
+        options = [
+            (x + dx, y + dy)
+            for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+            if 0 < x + dx < side - 1
+            and 0 < y + dy < side - 1
+            and cells[y + dy][x + dx] == "#"
+        ]
+        if not options:
+            stack.pop()
+            continue
+        nx, ny = rng.choice(options)
+        cells[(y + ny) // 2][(x + nx) // 2] = "."
+        cells[ny][nx] = "."
+        stack.append((nx, ny))
+    return cells
+
+
+def day_01(size: int, rng: random.Random) -> str:
+    """Two lists of size location ids, the right one partially repeating the left one."""
+    left = [rng.randrange(10000, 100000) for _ in range(size)]
+    right = [
+        rng.choice(left) if rng.random() < 0.3 else rng.randrange(10000, 100000)
+        for _ in range(size)
+    ]
+    return "\n".join(f"{a}   {b}" for a, b in zip(left, right))
+
+
+def day_02(size: int, rng: random.Random) -> str:
+    """Size reports, about half of them safe."""
+    reports = []
+    for _ in range(size):
+        sign = rng.choice((-1, 1))
+        levels = [rng.randrange(20, 80)]
+        for _ in range(rng.randrange(4, 8)):
+            levels.append(levels[-1] + sign * rng.randrange(1, 4))
+        if rng.random() < 0.5:
+            levels[rng.randrange(len(levels))] = rng.randrange(1, 100)
+        reports.append(" ".join(map(str, levels)))
+    return "\n".join(reports)
+
+
+def day_03(size: int, rng: random.Random) -> str:
+    """Corrupted memory with size instructions, spread over lines of about 3000 characters."""
+    junk = [
+        "mul[3,7]",
+        "mul(4*",
+        "?(12,34)",
+        "mul ( 2 , 4 )",
+        "don't",
+        "from()",
+        "select()",
+        "how()",
+        "%&",
+        "^",
+        "]",
+        "'",
+        "+",
+        "<",
+        ">",
+        "@",
+        "what()",
+        "why()",
+        "#",
+    ]
+    chunks = []
+    for _ in range(size):
+        for _ in range(rng.randrange(0, 4)):
+            chunks.append(rng.choice(junk))
+        chance = rng.random()
+        if chance < 0.05:
+            chunks.append("do()")
+        elif chance < 0.1:
+            chunks.append("don't()")
+        else:
+            chunks.append(f"mul({rng.randrange(1, 1000)},{rng.randrange(1, 1000)})")
+
+    lines = []
+    line = ""
+    for chunk in chunks:
+        line += chunk
+        if len(line) >= 3000:
+            lines.append(line)
+            line = ""
+    lines.append(line)
+    return "\n".join(lines)
+
+
+def day_04(size: int, rng: random.Random) -> str:
+    """Word search of size by size letters."""
+    return _lines(rng.choices("XMAS", k=size) for _ in range(size))
+
+
+def day_05(size: int, rng: random.Random) -> str:
+    """Ordering rules for pages 10-99 and size updates of up to 23 pages."""
+    pages = list(range(10, 100))
+    rng.shuffle(pages)
+    window = 25
+    rules = [
+        f"{pages[i]}|{pages[j]}"
+        for i in range(len(pages))
+        for j in range(i + 1, min(i + window, len(pages)))
+    ]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(size):
+        start = rng.randrange(len(pages) - window)
+        update = rng.sample(pages[start : start + window], rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(",".join(map(str, update)))
+    return "\n".join(rules) + "\n\n" + "\n".join(updates)
+
+
+def day_06(size: int, rng: random.Random) -> str:
+    """Lab of size by size positions, with a guard that eventually leaves the lab."""
+    side = max(size, 4)
+    directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+    while True:
+        rows = [
+            ["#" if rng.random() < 0.02 else "." for _ in range(side)]
+            for _ in range(side)
+        ]
+        x, y = rng.randrange(side), rng.randrange(side)
+        rows[y][x] = "^"
+
+        # Only accept labs the guard leaves, the solution would loop forever
+        direction = 0
+        seen = set()
+        while (x, y, direction) not in seen:
+            seen.add((x, y, direction))
+            dx, dy = directions[direction]
+            if not (0 <= x + dx < side and 0 <= y + dy < side):
+                return _lines(rows)
+            if rows[y + dy][x + dx] == "#":
+                direction = (direction + 1) % 4
+            else:
+                x, y = x + dx, y + dy
+
+
+def day_07(size: int, rng: random.Random) -> str:
+    """Size equations of 2 to 12 numbers, about half of them solvable."""
+    equations = []
+    for _ in range(size):
+        numbers = [rng.randrange(1, 100) for _ in range(rng.randrange(2, 13))]
+        result = numbers[0]
+        for number in numbers[1:]:
+            result = rng.choice(
+                (result + number, result * number, int(f"{result}{number}"))
+            )
+        if rng.random() < 0.5:
+            result += 1
+        equations.append(f"{result}: {' '.join(map(str, numbers))}")
+    return "\n".join(equations)
+
+
+def day_08(size: int, rng: random.Random) -> str:
+    """Map of size by size positions with antennas of up to 62 frequencies.
+
+    The antennas of a frequency never share a row or column, as the solution
+    divides by the difference between antennas.
+    """
+    side = max(size, 4)
+    rows = [["."] * side for _ in range(side)]
+    frequencies = string.ascii_letters + string.digits
+    per_frequency = min(max(4, side // 12), side)
+    for frequency in frequencies[: max(1, min(len(frequencies), side // 4))]:
+        for x, y in zip(
+            rng.sample(range(side), per_frequency),
+            rng.sample(range(side), per_frequency),
+        ):
+            if rows[y][x] == ".":
+                rows[y][x] = frequency
+    return _lines(rows)
+
+
+def day_09(size: int, rng: random.Random) -> str:
+    """Disk map of size digits (rounded up to an odd number)."""
+    digits = [
+        str(rng.randrange(1, 10)) if i % 2 == 0 else str(rng.randrange(10))
+        for i in range(size | 1)
+    ]
+    return "".join(digits)
+
+
+def day_10(size: int, rng: random.Random) -> str:
+    """Topographic map of size by size positions, with some noise on a slope."""
+    return _lines(
+        (
+            str(rng.randrange(10)) if rng.random() < 0.1 else str((x + y) % 10)
+            for x in range(size)
+        )
+        for y in range(size)
+    )
+
+
+def day_11(size: int, rng: random.Random) -> str:
+    """Size stones."""
+    return " ".join(str(rng.randrange(1000000)) for _ in range(size))
+
+
+def day_12(size: int, rng: random.Random) -> str:
+    """Garden of size by size plots, in irregular regions."""
+    blocks = [
+        [rng.choice(string.ascii_uppercase) for _ in range(size // 4 + 1)]
+        for _ in range(size // 4 + 1)
+    ]
+    rows = []
+    for y in range(size):
+        row = []
+        for x in range(size):
+            dx, dy = rng.choice(((0, 0), (0, 0), (0, 0), (1, 0), (0, 1)))
+            last = len(blocks) - 1
+            row.append(blocks[min(y // 4 + dy, last)][min(x // 4 + dx, last)])
+        rows.append(row)
+    return _lines(rows)
+
+
+def _claw_winnable_or_not(a: tuple, b: tuple, prize: list) -> bool:
+    """Whether the presses of buttons A and B reaching a prize (Cramer's rule) are
+    either fractional, so the prize can not be won, or non-negative integers.
+    """
+    div = a[0] * b[1] - a[1] * b[0]
+    presses = (
+        fractions.Fraction(prize[0] * b[1] - prize[1] * b[0], div),
+        fractions.Fraction(a[0] * prize[1] - a[1] * prize[0], div),
+    )
+    return any(count.denominator != 1 for count in presses) or min(presses) >= 0
+
+
+def day_13(size: int, rng: random.Random) -> str:
+    """Size claw machines, about half of them winnable.
+
+    The solver takes any integer solution as the way to win a prize, so every
+    machine is regenerated until its presses, for the prize and for the prize
+    moved by 10^13 in part 2, are either fractional or non-negative integers.
+    """
+    machines = []
+    for _ in range(size):
+        while True:
+            a = (rng.randrange(10, 100), rng.randrange(10, 100))
+            b = (rng.randrange(10, 100), rng.randrange(10, 100))
+            if a[0] * b[1] == a[1] * b[0]:
+                continue
+            presses = (rng.randrange(1, 101), rng.randrange(1, 101))
+            prize = [presses[0] * a[i] + presses[1] * b[i] for i in range(2)]
+            if rng.random() < 0.5:
+                prize = [value + rng.randrange(1, 50) for value in prize]
+            if all(
+                _claw_winnable_or_not(a, b, [value + offset for value in prize])
+                for offset in (0, 10000000000000)
+            ):
+                break
+        machines.append(
+            f"Button A: X+{a[0]}, Y+{a[1]}\n"
+            f"Button B: X+{b[0]}, Y+{b[1]}\n"
+            f"Prize: X={prize[0]}, Y={prize[1]}"
+        )
+    return "\n\n".join(machines)
+
+
+def day_14(size: int, rng: random.Random) -> str:
+    """Size robots (at most 10403) on a 101 by 103 space.
+
+    All robots are on a unique position after a random number of seconds below
+    10000, the first robot starts in the bottom right corner to fix the size of
+    the space.
+    """
+    columns, rows = 101, 103
+    seconds = rng.randrange(100, 10000)
+    count = max(1, min(size, columns * rows))
+
+    velocities = [
+        (rng.randrange(-100, 101), rng.randrange(-100, 101)) for _ in range(count)
+    ]
+    corner = (
+        (columns - 1 + seconds * velocities[0][0]) % columns,
+        (rows - 1 + seconds * velocities[0][1]) % rows,
+    )
+    cells = [(x, y) for x in range(columns) for y in range(rows) if (x, y) != corner]
+    positions = [corner] + rng.sample(cells, count - 1)
+
+    robots = []
+    for (x, y), (vx, vy) in zip(positions, velocities):
+        start = ((x - seconds * vx) % columns, (y - seconds * vy) % rows)
+        robots.append(f"p={start[0]},{start[1]} v={vx},{vy}")
+    return "\n".join(robots)
+
+
+def day_15(size: int, rng: random.Random) -> str:
+    """Warehouse of size by size positions with 8 moves per position."""
+    side = max(size, 5)
+    rows = [
+        [
+            (
+                "#"
+                if x in (0, side - 1) or y in (0, side - 1)
+                else rng.choices("#O.", (1, 5, 14))[0]
+            )
+            for x in range(side)
+        ]
+        for y in range(side)
+    ]
+    rows[rng.randrange(1, side - 1)][rng.randrange(1, side - 1)] = "@"
+    moves = "".join(rng.choices("<>^v", k=8 * side * side))
+    return (
+        _lines(rows)
+        + "\n\n"
+        + "\n".join(moves[i : i + 1000] for i in range(0, len(moves), 1000))
+    )
+
+
+def day_16(size: int, rng: random.Random) -> str:
+    """Maze of size by size positions (an odd side), with loops."""
+    cells = _maze(size, rng)
+    side = len(cells)
+    for _ in range(side * side // 50):
+        x, y = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+        if (x + y) % 2 == 1:
+            cells[y][x] = "."
+    cells[side - 2][1] = "S"
+    cells[1][side - 2] = "E"
+    return _lines(cells)
+
+
+def day_17(size: int, rng: random.Random) -> str:
+    """Program with register A holding size octal digits, one output per digit."""
+    register = rng.randrange(8 ** max(size - 1, 0), 8**size)
+    program = [2, 4, 1, rng.randrange(8), 7, 5, 1, rng.randrange(8), 4, 4, 0, 3, 5, 5]
+    program += [3, 0]
+    return (
+        f"Register A: {register}\nRegister B: 0\nRegister C: 0\n\n"
+        f"Program: {','.join(map(str, program))}"
+    )
+
+
+def day_18(size: int, rng: random.Random) -> str:
+    """Size falling bytes (at most 5039), the solution fixes the memory space at 71 by 71."""
+    side = 71
+    cells = [
+        (x, y)
+        for x in range(side)
+        for y in range(side)
+        if (x, y) not in ((0, 0), (side - 1, side - 1))
+    ]
+    return "\n".join(
+        f"{x},{y}" for x, y in rng.sample(cells, max(1, min(size, len(cells))))
+    )
+
+
+def day_19(size: int, rng: random.Random) -> str:
+    """About 450 towel patterns and size designs, most of them possible."""
+    patterns = {"w", "u", "b", "r"}
+    while len(patterns) < 450:
+        patterns.add("".join(rng.choices("wubrg", k=rng.randrange(2, 9))))
+    ordered = sorted(patterns)
+    rng.shuffle(ordered)
+
+    designs = []
+    for _ in range(size):
+        length = rng.randrange(40, 61)
+        if rng.random() < 0.2:
+            designs.append("".join(rng.choices("wubrg", k=length)))
+            continue
+        design = ""
+        while len(design) < length:
+            design += rng.choice(ordered)
+        designs.append(design)
+    return ", ".join(ordered) + "\n\n" + "\n".join(designs)
+
+
+def day_20(size: int, rng: random.Random) -> str:
+    """Race track of size by size positions (an odd side), a single winding path."""
+    cells = _maze(size, rng)
+    side = len(cells)
+    start, end = (1, side - 2), (side - 2, 1)
+
+    previous = {start: None}
+    queue = collections.deque([start])
+    while queue:
+        x, y = queue.popleft()
+        for option in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if cells[option[1]][option[0]] == "." and option not in previous:
+                previous[option] = (x, y)
+                queue.append(option)
+
+    track = [["#"] * side for _ in range(side)]
+    position = end
+    while position is not None:
+        track[position[1]][position[0]] = "."
+        position = previous[position]
+    track[start[1]][start[0]] = "S"
+    track[end[1]][end[0]] = "E"
+    return _lines(track)
+
+
+def day_21(size: int, rng: random.Random) -> str:
+    """Size door codes."""
+    return "\n".join(f"{rng.randrange(1000):03}A" for _ in range(size))
+
+
+def day_22(size: int, rng: random.Random) -> str:
+    """Initial secrets of size buyers."""
+    return "\n".join(str(rng.randrange(1, 16777216)) for _ in range(size))
+
+
+def day_23(size: int, rng: random.Random) -> str:
+    """Network of size computers (at most 676) with 13 connections each.
+
+    A single LAN party of 13 computers is hidden in the network, each of its
+    computers has one connection outside of the party.
+    """
+    names = [
+        "".join(name) for name in itertools.product(string.ascii_lowercase, repeat=2)
+    ]
+    names = rng.sample(names, max(20, min(size, len(names))))
+    party_size = min(13, len(names) // 2)
+    party, others = names[:party_size], names[party_size:]
+
+    connections = set(itertools.combinations(party, 2))
+    connections.update(zip(party, rng.sample(others, party_size)))
+    degree = min(13, len(others) - 1)
+    for _ in range(len(others) * degree // 2):
+        first, second = rng.sample(others, 2)
+        if (second, first) not in connections:
+            connections.add((first, second))
+
+    lines = [
+        f"{first}-{second}" if rng.random() < 0.5 else f"{second}-{first}"
+        for first, second in connections
+    ]
+    lines.sort()
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+def day_24(size: int, rng: random.Random) -> str:
+    """Ripple-carry adder of size bits (6 to 99), with up to 4 pairs of swapped outputs.
+
+    Wire names have three characters, limiting the adder to 99 bits. The swaps
+    exchange the sum output of a stage with its carry, or the XOR and AND of its
+    inputs, as found in the real inputs.
+    """
+    bits = max(6, min(size, 99))
+    used = set()
+
+    def wire() -> str:
+        while True:
+            name = "".join(rng.choices(string.ascii_lowercase[:23], k=3))
+            if name not in used:
+                used.add(name)
+                return name
+
+    gates = {("x00", "XOR", "y00"): "z00", ("x00", "AND", "y00"): wire()}
+    carry = gates[("x00", "AND", "y00")]
+    stages = {}
+    for i in range(1, bits):
+        x, y = f"x{i:02}", f"y{i:02}"
+        partial = gates[(x, "XOR", y)] = wire()
+        generate = gates[(x, "AND", y)] = wire()
+        gates[(partial, "XOR", carry)] = f"z{i:02}"
+        propagate = gates[(partial, "AND", carry)] = wire()
+        output = f"z{bits:02}" if i == bits - 1 else wire()
+        stages[i] = [(x, "XOR", y), (x, "AND", y)]
+        stages[i] += [(partial, "XOR", carry), (generate, "OR", propagate)]
+        carry = gates[(generate, "OR", propagate)] = output
+
+    # Swap outputs within a stage, which never creates a cycle
+    for i in rng.sample(range(2, bits - 2), min(4, bits - 4)):
+        partial, generate, total, carry = stages[i]
+        first, second = (partial, generate) if rng.random() < 0.5 else (total, carry)
+        gates[first], gates[second] = gates[second], gates[first]
+
+    values = [f"x{i:02}: {rng.randrange(2)}" for i in range(bits)]
+    values += [f"y{i:02}: {rng.randrange(2)}" for i in range(bits)]
+    lines = [
+        f"{first} {operation} {second} -> {output}"
+        for (first, operation, second), output in gates.items()
+    ]
+    rng.shuffle(lines)
+    return "\n".join(values) + "\n\n" + "\n".join(lines)
+
+
+def day_25(size: int, rng: random.Random) -> str:
+    """Size schematics of locks and keys."""
+    schematics = []
+    for _ in range(size):
+        heights = [rng.randrange(6) for _ in range(5)]
+        if rng.random() < 0.5:
+            rows = [
+                "".join("#" if row <= height else "." for height in heights)
+                for row in range(7)
+            ]
+        else:
+            rows = [
+                "".join("#" if row >= 6 - height else "." for height in heights)
+                for row in range(7)
+            ]
+        schematics.append("\n".join(rows))
+    return "\n\n".join(schematics)
+
+
+GENERATORS = {
+    1: day_01,
+    2: day_02,
+    3: day_03,
+    4: day_04,
+    5: day_05,
+    6: day_06,
+    7: day_07,
+    8: day_08,
+    9: day_09,
+    10: day_10,
+    11: day_11,
+    12: day_12,
+    13: day_13,
+    14: day_14,
+    15: day_15,
+    16: day_16,
+    17: day_17,
+    18: day_18,
+    19: day_19,
+    20: day_20,
+    21: day_21,
+    22: day_22,
+    23: day_23,
+    24: day_24,
+    25: day_25,
+}
@@ -0,0 +1,214 @@
+"""Benchmark history in SQLite, to follow the timings of every day over time"""
+
+import contextlib
+import pathlib
+import sqlite3
+import typing
+
+from .discovery import ROOT
+
+HISTORY_DB = ROOT / "history.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started TEXT NOT NULL,
+    revision TEXT,
+    python TEXT NOT NULL,
+    repeat INTEGER NOT NULL,
+    warmup INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS timings (
+    run INTEGER NOT NULL REFERENCES runs (id),
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    module TEXT NOT NULL,
+    status TEXT NOT NULL,
+    input_sha256 TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    min REAL NOT NULL,
+    median REAL NOT NULL,
+    mean REAL NOT NULL,
+    p95 REAL NOT NULL,
+    stdev REAL NOT NULL,
+    peak_bytes INTEGER,
+    retained_bytes INTEGER
+);
+CREATE INDEX IF NOT EXISTS timings_by_day ON timings (year, module, phase);
+"""
+
+
+class Trend(typing.NamedTuple):
+    """Timing history of a single day and phase, on its latest input.
+
+    Attributes:
+        year (int): year of the puzzle.
+        module (str): name of the day module.
+        fastest (tuple): (median, revision, started) of the fastest solved run.
+        latest (tuple): (median, revision, started, status) of the latest run.
+        change (float): relative change of the latest median to the fastest one.
+        regression (tuple): (revision, started) of the first run of the ongoing
+            regression: the latest runs exceeding the threshold, or not solved.
+            None when the latest run is within the threshold.
+    """
+
+    year: int
+    module: str
+    fastest: tuple[float, str, str]
+    latest: tuple[float, str, str, str]
+    regression: typing.Optional[tuple[str, str]]
+
+    @property
+    def change(self: "Trend") -> float:
+        """Relative change of the latest median to the fastest one."""
+        return self.latest[0] / self.fastest[0] - 1
+
+
+@contextlib.contextmanager
+def connect(path: pathlib.Path) -> typing.Generator[sqlite3.Connection, None, None]:
+    """Open the history database, creating the tables when needed."""
+    connection = sqlite3.connect(path)
+    try:
+        connection.executescript(SCHEMA)
+        with connection:
+            yield connection
+    finally:
+        connection.close()
+
+
+def store_report(path: pathlib.Path, report: dict) -> int:
+    """Append the results of a run to the history, leaving out cached results.
+
+    Args:
+        path: history database.
+        report: run information and per day results, as written by --output.
+
+    Returns:
+        The id of the run in the history.
+    """
+    with connect(path) as connection:
+        cursor = connection.execute(
+            "INSERT INTO runs (started, revision, python, repeat, warmup) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                report["started"],
+                report["revision"],
+                report["python"],
+                report["repeat"],
+                report["warmup"],
+            ),
+        )
+        run = cursor.lastrowid
+        rows = []
+        for result in report["results"]:
+            if result.get("cached"):
+                continue
+            for phase, timing in result["timings"].items():
+                memory = (result.get("memory") or {}).get(phase, {})
+                rows.append(
+                    (
+                        run,
+                        result["year"],
+                        result["day"],
+                        result["module"],
+                        result["status"],
+                        result["input_sha256"],
+                        phase,
+                        timing["count"],
+                        timing["min"],
+                        timing["median"],
+                        timing["mean"],
+                        timing["p95"],
+                        timing["stdev"],
+                        memory.get("peak"),
+                        memory.get("retained"),
+                    )
+                )
+        connection.executemany(
+            f"INSERT INTO timings VALUES ({', '.join('?' * 15)})", rows
+        )
+    return run
+
+
+def find_trends(
+    path: pathlib.Path,
+    years: typing.Optional[list[int]] = None,
+    days: typing.Optional[list[int]] = None,
+    phase: str = "solve",
+    threshold: float = 0.1,
+) -> list[Trend]:
+    """Summarize the history of every day, comparing runs on the latest input only.
+
+    Args:
+        path: history database.
+        years: only include these years, None for all years.
+        days: only include these days, None for all days.
+        phase: the compared phase.
+        threshold: relative slowdown compared to the fastest run counting as a
+            regression, 0.1 for 10%.
+
+    Returns:
+        The trend of every day with at least one solved run, ordered by year and
+        module.
+    """
+    query = (
+        "SELECT year, day, module, status, input_sha256, median, revision, started "
+        "FROM timings JOIN runs ON runs.id = timings.run WHERE phase = ? "
+        "ORDER BY year, module, run"
+    )
+    history = {}
+    with connect(path) as connection:
+        for year, day, module, *row in connection.execute(query, (phase,)):
+            if (years is None or year in years) and (days is None or day in days):
+                history.setdefault((year, module), []).append(row)
+
+    trends = []
+    for (year, module), rows in history.items():
+        latest_status, latest_input, *latest = rows[-1]
+        rows = [row for row in rows if row[1] == latest_input]
+        solved = [index for index, row in enumerate(rows) if row[0] == "OK"]
+        if not solved:
+            continue
+
+        # fastest run, the earliest one on a tie
+        _, best = min((rows[index][2], index) for index in solved)
+        limit = rows[best][2] * (1 + threshold)
+        regression = None
+        for status, _, median, revision, started in reversed(rows[best + 1 :]):
+            if status == "OK" and median <= limit:
+                break
+            regression = (revision, started)
+        trends.append(
+            Trend(
+                year,
+                module,
+                tuple(rows[best][2:]),
+                (*latest, latest_status),
+                regression,
+            )
+        )
+    return trends
+
+
+def last_durations(
+    path: pathlib.Path, phase: str = "solve"
+) -> dict[tuple[int, str], float]:
+    """Median time of every day in its latest solved run, for scheduling.
+
+    Args:
+        path: history database.
+        phase: the phase to report.
+
+    Returns:
+        The median time in seconds by year and module.
+    """
+    query = (
+        "SELECT year, module, median FROM timings JOIN runs ON runs.id = timings.run "
+        "WHERE phase = ? AND status = 'OK' ORDER BY run"
+    )
+    with connect(path) as connection:
+        return {
+            (year, module): median
+            for year, module, median in connection.execute(query, (phase,))
+        }
@@ -0,0 +1,121 @@
+"""Local store of puzzle inputs"""
+
+import hashlib
+import json
+import os
+import pathlib
+import typing
+
+from .startup import lazy_import
+
+INPUT_STORE = pathlib.Path(__file__).parent.parent.resolve() / "inputs"
+AOCD_DIR = pathlib.Path(os.environ.get("AOCD_DIR", "~/.config/aocd")).expanduser()
+INPUT_URL = "https://adventofcode.com"
+
+
+class InputStore:
+    """Content-addressed store of puzzle inputs, so runs do not depend on aocd.
+
+    Every input is stored once, in a file named after the SHA-256 of its content.
+    An index maps each year and day to the digest of its input.
+    """
+
+    def __init__(self: "InputStore", root: pathlib.Path) -> None:
+        """Initialize InputStore.
+
+        Args:
+            root: directory containing the index and the objects.
+        """
+        self._objects = root / "objects"
+        self._index_path = root / "index.json"
+        self._index = {}
+        if self._index_path.exists():
+            self._index = json.loads(self._index_path.read_text(encoding="utf-8"))
+
+    def __iter__(
+        self: "InputStore",
+    ) -> typing.Generator[tuple[int, int, str], None, None]:
+        """Iterate over the (year, day, digest) of all stored inputs."""
+        for key, digest in sorted(self._index.items()):
+            year, day = key.split("-")
+            yield int(year), int(day), digest
+
+    def digest(self: "InputStore", year: int, day: int) -> typing.Optional[str]:
+        """SHA-256 of the stored input of a day, None when not stored."""
+        return self._index.get(f"{year}-{day:02}")
+
+    def get(self: "InputStore", year: int, day: int) -> typing.Optional[str]:
+        """Read the input of a day.
+
+        The bytes are decoded as stored, without translating the line endings,
+        so the input matches its digest.
+
+        Returns:
+            The input, None when not stored.
+        """
+        digest = self.digest(year, day)
+        if digest is None:
+            return None
+        return (self._objects / digest).read_bytes().decode("utf-8")
+
+    def put(self: "InputStore", year: int, day: int, data: str) -> str:
+        """Store the input of a day, replacing an earlier input.
+
+        Returns:
+            The SHA-256 of the input.
+        """
+        content = data.encode("utf-8")
+        digest = hashlib.sha256(content).hexdigest()
+
+        self._objects.mkdir(parents=True, exist_ok=True)
+        path = self._objects / digest
+        if not path.exists():
+            path.with_suffix(".tmp").write_bytes(content)
+            path.with_suffix(".tmp").replace(path)
+
+        self._index[f"{year}-{day:02}"] = digest
+        self._index_path.with_suffix(".tmp").write_text(
+            json.dumps(self._index, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        self._index_path.with_suffix(".tmp").replace(self._index_path)
+        return digest
+
+
+def load_input(store: InputStore, year: int, day: int) -> tuple[str, str]:
+    """Read the input of a day from the store, fetching it with aocd when missing.
+
+    The runner fetches missing inputs ahead with aoc.prefetch, so this only
+    fetches inputs itself when used on its own.
+
+    aocd, with its HTTP and HTML parsing dependencies, is only imported when an
+    input is missing, so runs with stored inputs start faster.
+
+    Returns:
+        The input and its SHA-256.
+    """
+    data = store.get(year, day)
+    if data is None:
+        data = lazy_import("aocd").get_data(day=day, year=year)
+        store.put(year, day, data)
+    return data, store.digest(year, day)
+
+
+def import_inputs(store: InputStore, source: pathlib.Path) -> None:
+    """Import all inputs found in a directory, for example the aocd cache.
+
+    Inputs are recognized by the aocd naming: YYYY_DD_input.txt.
+    """
+    for path in sorted(source.rglob("[0-9][0-9][0-9][0-9]_[0-9][0-9]_input.txt")):
+        year, day, _ = path.name.split("_")
+        data = path.read_text(encoding="utf-8").rstrip("\r\n")
+        digest = store.put(int(year), int(day), data)
+        print(f"Imported {year} day {int(day)}: {digest}")
+
+
+def export_inputs(store: InputStore, destination: pathlib.Path) -> None:
+    """Export all stored inputs to a directory, using the aocd naming."""
+    destination.mkdir(parents=True, exist_ok=True)
+    for year, day, digest in store:
+        path = destination / f"{year}_{day:02}_input.txt"
+        path.write_text(store.get(year, day), encoding="utf-8")
+        print(f"Exported {year} day {day}: {digest}")
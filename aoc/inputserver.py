@@ -0,0 +1,85 @@
+"""Local stand-in for the puzzle input endpoint, to try the prefetcher without network"""
+
+import http.server
+import logging
+import pathlib
+import random
+import re
+import time
+
+
+class InputRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Serve /{year}/day/{day}/input from a directory of YYYY_DD_input.txt files.
+
+    Like the real endpoint, a session cookie is required. The server can add a
+    delay to every response and fail a fraction of the requests, to exercise
+    concurrency and retries.
+    """
+
+    directory = pathlib.Path(".")
+    delay = 0.0
+    fail_rate = 0.0
+
+    def do_GET(self: "InputRequestHandler") -> None:  # pylint: disable=invalid-name
+        """Respond with the requested input."""
+        time.sleep(self.delay)
+        match = re.fullmatch(r"/(\d{4})/day/(\d{1,2})/input", self.path)
+        if match is None:
+            self.send_error(404)
+            return
+        if "session=" not in self.headers.get("Cookie", ""):
+            self._respond(
+                400,
+                "Puzzle inputs differ by user.  Please log in to get your puzzle input.\n",
+            )
+            return
+        if random.random() < self.fail_rate:
+            self.send_error(503)
+            return
+
+        path = self.directory / f"{match.group(1)}_{int(match.group(2)):02}_input.txt"
+        if not path.exists():
+            self.send_error(404)
+            return
+        self._respond(200, path.read_text(encoding="utf-8") + "\n")
+
+    def _respond(self: "InputRequestHandler", status: int, text: str) -> None:
+        """Send a plain text response."""
+        content = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(  # pylint: disable=redefined-builtin
+        self: "InputRequestHandler", format: str, *args
+    ) -> None:
+        logging.info("%s %s", self.address_string(), format % args)
+
+
+def serve_inputs(
+    directory: pathlib.Path,
+    port: int = 8000,
+    delay: float = 0.0,
+    fail_rate: float = 0.0,
+) -> None:
+    """Serve the inputs of a directory until interrupted.
+
+    Args:
+        directory: inputs named like the aocd cache, YYYY_DD_input.txt.
+        port: local port to listen on.
+        delay: seconds to wait before every response.
+        fail_rate: fraction of the requests failing with 503 Service Unavailable.
+    """
+    handler = type(
+        "Handler",
+        (InputRequestHandler,),
+        {"directory": directory, "delay": delay, "fail_rate": fail_rate},
+    )
+    with http.server.ThreadingHTTPServer(("127.0.0.1", port), handler) as server:
+        logging.info("Serving %s on http://127.0.0.1:%d", directory, port)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,123 @@
+"""Memory usage of the solve step, and its phases, of a day"""
+
+import contextlib
+import gc
+import pathlib
+import tracemalloc
+import types
+import typing
+
+from .discovery import ROOT
+from .timing import has_phases, reset_caches, run_once
+
+
+def format_size(size: int) -> str:
+    """Describe a number of bytes in a human readable way."""
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.4g} {unit}"
+        size /= 1024
+    return f"{size:.4g} GiB"
+
+
+class MemoryTracer:
+    """Trace the memory allocated by the phases of a day with tracemalloc.
+
+    For every phase this records the peak of the traced memory and the memory
+    still allocated at the end of the phase (retained), both relative to the
+    start of the phase, and the allocation sites of the retained memory. Days
+    with separate phases are only traced per phase, as the snapshots taken for
+    a phase would otherwise count towards the enclosing solve step. Tracing must
+    be started before entering a phase.
+
+    Attributes:
+        usage (dict): per phase the "peak" and "retained" bytes and the "sites",
+            a list of (location, bytes, blocks) tuples ordered by size.
+    """
+
+    def __init__(self: "MemoryTracer", phased: bool, top: int = 10) -> None:
+        """Initialize MemoryTracer.
+
+        Args:
+            phased: whether the day has separate phases.
+            top: number of allocation sites listed per phase.
+        """
+        self.usage = {}
+        self._phased = phased
+        self._top = top
+
+    @contextlib.contextmanager
+    def measure(self: "MemoryTracer", phase: str) -> typing.Generator[None, None, None]:
+        """Trace the memory allocated by a phase.
+
+        Args:
+            phase: name of the phase.
+        """
+        if self._phased and phase == "solve":
+            yield
+            return
+
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            self.usage[phase] = {
+                "peak": peak - start,
+                "retained": current - start,
+                "sites": self._sites(before, tracemalloc.take_snapshot()),
+            }
+
+    def _sites(
+        self: "MemoryTracer",
+        before: tracemalloc.Snapshot,
+        after: tracemalloc.Snapshot,
+    ) -> list[tuple[str, int, int]]:
+        """Find the locations allocating most of the retained memory."""
+        ignored = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, str(ROOT / "aoc" / "*")),
+        ]
+        differences = after.filter_traces(ignored).compare_to(
+            before.filter_traces(ignored), "lineno"
+        )
+        differences = sorted(
+            (difference for difference in differences if difference.size_diff > 0),
+            key=lambda difference: difference.size_diff,
+            reverse=True,
+        )
+
+        sites = []
+        for difference in differences[: self._top]:
+            frame = difference.traceback[0]
+            path = pathlib.Path(frame.filename)
+            if path.is_relative_to(ROOT):
+                path = path.relative_to(ROOT)
+            sites.append(
+                (f"{path}:{frame.lineno}", difference.size_diff, difference.count_diff)
+            )
+        return sites
+
+
+def trace_day(module: types.ModuleType, data: str, top: int = 10) -> dict:
+    """Solve a day once while tracing the memory allocations of every phase.
+
+    Args:
+        module: day module.
+        data: puzzle input.
+        top: number of allocation sites listed per phase.
+
+    Returns:
+        The memory usage per phase, see MemoryTracer.usage.
+    """
+    reset_caches(module)
+    gc.collect()
+    tracer = MemoryTracer(has_phases(module), top)
+    tracemalloc.start()
+    try:
+        run_once(module, data, tracer.measure)
+    finally:
+        tracemalloc.stop()
+    return tracer.usage
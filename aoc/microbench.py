@@ -0,0 +1,218 @@
+"""Microbenchmarks of the utilities, comparing them to their earlier implementations
+
+Every benchmark times a set of basic operations on the earlier and the current
+implementation of a utility, then solves some days that depend on it with both
+implementations, on generated inputs.
+"""
+
+import contextlib
+import logging
+import statistics
+import sys
+import timeit
+import typing
+
+from .discovery import Day, load_module
+from .generators import generate_input
+from .timing import benchmark
+
+
+class LegacyCoordinate:
+    """Coordinate of the utilities before it was backed by a tuple."""
+
+    def __init__(self, x, y) -> "LegacyCoordinate":
+        self.x = x
+        self.y = y
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
+    def __repr__(self) -> str:
+        return f"<Coordinate x: {self.x}, y:{self.y}>"
+
+    def __add__(self, other: "LegacyCoordinate") -> "LegacyCoordinate":
+        return LegacyCoordinate(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other: "LegacyCoordinate") -> "LegacyCoordinate":
+        return LegacyCoordinate(self.x - other.x, self.y - other.y)
+
+    def __mul__(self, other):
+        if isinstance(other, int):
+            return LegacyCoordinate(self.x * other, self.y * other)
+        raise TypeError
+
+    def __rmul__(self, other):
+        if isinstance(other, int):
+            return LegacyCoordinate(self.x * other, self.y * other)
+        raise TypeError
+
+    def __eq__(self, other: "LegacyCoordinate") -> bool:
+        try:
+            return self.x == other.x and self.y == other.y
+        except AttributeError:
+            return self.x == other[0] and self.y == other[1]
+
+    def __lt__(self, other: "LegacyCoordinate") -> bool:
+        return (self.x, self.y) < (other.x, other.y)
+
+    def neighbours(self) -> typing.Generator["LegacyCoordinate", None, None]:
+        deltas = [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+        for delta in deltas:
+            yield LegacyCoordinate(self.x + delta[0], self.y + delta[1])
+
+
+def legacy_new_tuple(cls: type, values: tuple) -> typing.Any:
+    """Stand-in for _new_tuple of the utilities while benchmarking LegacyCoordinate.
+
+    The utilities create coordinates with tuple.__new__ rather than by calling
+    Coordinate, skipping the Python level __new__ of the named tuple, which
+    creates the coordinates in the arithmetic about twice as fast. For the same
+    reason the arithmetic indexes the coordinates instead of unpacking them.
+    LegacyCoordinate is not a tuple, so it is created by calling it.
+    """
+    return cls(*values)
+
+
+def coordinate_operations(coordinate: type) -> dict[str, typing.Callable]:
+    """Operations on the 10000 coordinates of a 100x100 grid, as used by the days."""
+    pairs = [(x, y) for y in range(100) for x in range(100)]
+    points = [coordinate(x, y) for x, y in pairs]
+    step = coordinate(1, 0)
+    visited = set(points)
+    costs = dict.fromkeys(points, 0)
+    return {
+        "create": lambda: [coordinate(x, y) for x, y in pairs],
+        "add": lambda: [point + step for point in points],
+        "hash": lambda: [hash(point) for point in points],
+        "equality": lambda: [point == step for point in points],
+        "set membership": lambda: [point in visited for point in points],
+        "step and dict lookup": lambda: [costs.get(point + step) for point in points],
+        "attribute access": lambda: [point.x + point.y for point in points],
+    }
+
+
+class Microbenchmark:
+    """Comparison of the earlier and the current implementation of a utility.
+
+    Attributes:
+        name (str): name of the replaced utility in the utilities module.
+        legacy (dict[str, typing.Any]): earlier implementation of the utility,
+            by name, together with the helpers of the utilities depending on
+            the current implementation.
+        operations (typing.Callable): creates the timed operations for an
+            implementation.
+        days (list): (year, day, size) of the days solved with both
+            implementations, on generated inputs of that size.
+    """
+
+    def __init__(
+        self: "Microbenchmark",
+        name: str,
+        legacy: dict[str, typing.Any],
+        operations: typing.Callable[[typing.Any], dict[str, typing.Callable]],
+        days: list[tuple[int, int, int]],
+    ) -> None:
+        """Initialize Microbenchmark."""
+        self.name = name
+        self.legacy = legacy
+        self.operations = operations
+        self.days = days
+
+
+BENCHMARKS = {
+    "coordinate": Microbenchmark(
+        "Coordinate",
+        {"Coordinate": LegacyCoordinate, "_new_tuple": legacy_new_tuple},
+        coordinate_operations,
+        [(2024, 6, 300), (2024, 8, 200), (2024, 16, 40)],
+    ),
+}
+
+
+def best_time(function: typing.Callable, number: int = 10, repeat: int = 5) -> float:
+    """Shortest time of a single call in seconds, over `repeat` rounds of `number` calls."""
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+@contextlib.contextmanager
+def replaced(year: int, values: dict[str, typing.Any]) -> typing.Generator:
+    """Replace utilities of a year, importing the day modules again to use them.
+
+    The day modules are removed before and after, so their module level values
+    (like a list of directions) are created by the replaced utilities as well.
+    """
+    load_module(year, "utilities")
+    utilities = sys.modules[f"days_{year}.utilities"]
+    originals = {name: getattr(utilities, name) for name in values}
+
+    def forget_days():
+        prefix = f"days_{year}.day_"
+        for module in [module for module in sys.modules if module.startswith(prefix)]:
+            del sys.modules[module]
+
+    for name, value in values.items():
+        setattr(utilities, name, value)
+    forget_days()
+    try:
+        yield
+    finally:
+        for name, original in originals.items():
+            setattr(utilities, name, original)
+        forget_days()
+
+
+def compare_operations(
+    microbenchmark: Microbenchmark, year: int
+) -> list[tuple[str, float, float]]:
+    """Time the operations of both implementations.
+
+    Returns:
+        (operation, legacy time, current time) per operation, in seconds.
+    """
+    load_module(year, "utilities")
+    current = getattr(sys.modules[f"days_{year}.utilities"], microbenchmark.name)
+    legacy = microbenchmark.operations(microbenchmark.legacy[microbenchmark.name])
+    operations = microbenchmark.operations(current)
+    return [
+        (name, best_time(legacy[name]), best_time(operations[name]))
+        for name in operations
+    ]
+
+
+def compare_days(
+    microbenchmark: Microbenchmark, seed: int = 0, repeat: int = 3
+) -> list[tuple[Day, int, float, float]]:
+    """Solve the days of a benchmark with both implementations.
+
+    A warning is logged when the answers of both implementations differ.
+
+    Returns:
+        (day, input size, legacy median, current median) per day, in seconds.
+    """
+    comparisons = []
+    for year, number, size in microbenchmark.days:
+        day = Day(year, number, f"day_{number:02}")
+        data, _ = generate_input(year, number, size, seed)
+        with replaced(year, microbenchmark.legacy):
+            legacy = {}
+            expected = benchmark(load_module(year, day.module), data, legacy, repeat)
+        current = {}
+        solution = benchmark(load_module(year, day.module), data, current, repeat)
+        if solution != expected:
+            logging.warning(
+                "%d day %d: answers %s differ from %s with the legacy %s",
+                year,
+                number,
+                solution,
+                expected,
+                microbenchmark.name,
+            )
+        comparisons.append(
+            (
+                day,
+                size,
+                statistics.median(legacy["solve"]),
+                statistics.median(current["solve"]),
+            )
+        )
+    return comparisons
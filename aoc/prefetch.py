@@ -0,0 +1,165 @@
+"""Concurrent fetching of missing puzzle inputs, overlapping with solving the days"""
+
+import asyncio
+import concurrent.futures
+import dataclasses
+import logging
+import os
+import threading
+import typing
+import urllib.request
+
+from .inputs import AOCD_DIR, INPUT_URL, InputStore, load_input
+
+USER_AGENT = "aoc-runner (python urllib)"
+
+# Status codes worth another attempt: rate limiting and server side failures
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def session_token() -> typing.Optional[str]:
+    """Session cookie for the puzzle inputs, from AOC_SESSION or the aocd token file."""
+    token = os.environ.get("AOC_SESSION")
+    if token is None and (AOCD_DIR / "token").exists():
+        token = (AOCD_DIR / "token").read_text(encoding="utf-8")
+    return token.strip() if token else None
+
+
+@dataclasses.dataclass(frozen=True)
+class FetchOptions:
+    """Settings for fetching the puzzle inputs.
+
+    Attributes:
+        url (str): base url of the puzzle inputs, {url}/{year}/day/{day}/input.
+        connections (int): maximum number of concurrent requests.
+        retries (int): number of retries of a failed request.
+        backoff (float): delay before the first retry in seconds, doubling every
+            retry.
+        timeout (float): timeout of a single request in seconds.
+    """
+
+    url: str = INPUT_URL
+    connections: int = 4
+    retries: int = 3
+    backoff: float = 1.0
+    timeout: float = 30.0
+
+
+class Prefetcher:
+    """Fetch all missing inputs concurrently in a background thread.
+
+    An asyncio event loop downloads the inputs with at most `connections`
+    requests at a time, retrying failed requests with an exponential backoff,
+    and adds them to the store. Meanwhile the runner solves the days whose input
+    is available, waiting only for the input of the next day.
+    """
+
+    def __init__(
+        self: "Prefetcher",
+        store: InputStore,
+        days: list[tuple[int, int]],
+        options: FetchOptions = FetchOptions(),
+    ) -> None:
+        """Initialize Prefetcher.
+
+        Args:
+            store: receives the fetched inputs.
+            days: (year, day) of the inputs to fetch, when not stored yet.
+            options: how to fetch the inputs.
+        """
+        self._store = store
+        self._options = options
+        self._futures = {
+            key: concurrent.futures.Future()
+            for key in dict.fromkeys(days)
+            if store.digest(*key) is None
+        }
+        self._thread = None
+
+    def start(self: "Prefetcher") -> None:
+        """Start fetching the missing inputs, if any."""
+        if self._futures:
+            self._thread = threading.Thread(
+                target=asyncio.run, args=(self._fetch_all(),), daemon=True
+            )
+            self._thread.start()
+
+    def load(self: "Prefetcher", year: int, day: int) -> tuple[str, str]:
+        """Wait for the input of a day to be available and read it from the store.
+
+        Raises:
+            OSError: when fetching the input failed, for example urllib.error.HTTPError.
+
+        Returns:
+            The input and its SHA-256.
+        """
+        future = self._futures.get((year, day))
+        if future is not None:
+            future.result()
+        return load_input(self._store, year, day)
+
+    async def _fetch_all(self: "Prefetcher") -> None:
+        """Fetch all missing inputs, in order, with a bounded number of requests."""
+        token = session_token()
+        semaphore = asyncio.Semaphore(self._options.connections)
+        await asyncio.gather(
+            *(self._fetch(semaphore, token, key) for key in self._futures)
+        )
+
+    async def _fetch(
+        self: "Prefetcher",
+        semaphore: asyncio.Semaphore,
+        token: typing.Optional[str],
+        key: tuple[int, int],
+    ) -> None:
+        """Fetch and store the input of a day, reporting the outcome to its future."""
+        year, day = key
+        future = self._futures[key]
+        url = f"{self._options.url.rstrip('/')}/{year}/day/{day}/input"
+        cached = next(AOCD_DIR.glob(f"*/{year}_{day:02}_input.txt"), None)
+        try:
+            if cached is not None:
+                data = cached.read_text(encoding="utf-8").rstrip("\r\n")
+            else:
+                data = await self._download_with_retries(semaphore, url, token)
+            self._store.put(year, day, data)
+            logging.info("Fetched %d day %d", year, day)
+            future.set_result(None)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            future.set_exception(error)
+
+    async def _download_with_retries(
+        self: "Prefetcher",
+        semaphore: asyncio.Semaphore,
+        url: str,
+        token: typing.Optional[str],
+    ) -> str:
+        """Download an input, retrying with an exponential backoff.
+
+        Connection failures and the status codes in RETRY_STATUS are retried, other
+        HTTP errors (like 400 without a valid session, or 404) are raised at once.
+        """
+        attempt = 0
+        while True:
+            try:
+                async with semaphore:
+                    return await asyncio.to_thread(self._download, url, token)
+            except OSError as error:
+                status = getattr(error, "code", None)
+                if attempt == self._options.retries or (
+                    status is not None and status not in RETRY_STATUS
+                ):
+                    raise
+                delay = self._options.backoff * 2**attempt
+                logging.warning("%s: %s, retrying in %ss", url, error, delay)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def _download(self: "Prefetcher", url: str, token: typing.Optional[str]) -> str:
+        """Download an input, blocking, so it runs in a worker thread."""
+        headers = {"User-Agent": USER_AGENT}
+        if token is not None:
+            headers["Cookie"] = f"session={token}"
+        request = urllib.request.Request(url, headers=headers)
+        with urllib.request.urlopen(request, timeout=self._options.timeout) as response:
+            return response.read().decode("utf-8").rstrip("\r\n")
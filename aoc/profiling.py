@@ -0,0 +1,64 @@
+"""Profiling of the solve step, or a single phase, of a day"""
+
+import contextlib
+import cProfile
+import logging
+import pathlib
+import pstats
+import types
+import typing
+
+from .timing import has_phases, reset_caches, run_once
+
+
+@contextlib.contextmanager
+def profiled(
+    profiler: cProfile.Profile, enabled: bool
+) -> typing.Generator[None, None, None]:
+    """Profile a block when enabled, otherwise run it unprofiled."""
+    if not enabled:
+        yield
+        return
+
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+
+
+def profile_day(
+    module: types.ModuleType, data: str, phase: str, path: pathlib.Path
+) -> str:
+    """Solve a day once while profiling the solve step, or a single phase.
+
+    The phases preceding the profiled phase run unprofiled, so a phase gets the
+    same input as within the solve step. Days that do not follow the parse, part
+    1 and part 2 structure are always profiled as a whole.
+
+    Args:
+        module: day module.
+        data: puzzle input.
+        phase: "solve" for the complete solve step, "parse", "part1" or "part2".
+        path: file to write the profile statistics (pstats) to.
+
+    Returns:
+        The profiled phase.
+    """
+    if phase != "solve" and not has_phases(module):
+        logging.info("%s has no separate phases, profiling solve", module.__name__)
+        phase = "solve"
+
+    reset_caches(module)
+    profiler = cProfile.Profile()
+    run_once(module, data, lambda current: profiled(profiler, current == phase))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(path)
+    return phase
+
+
+def print_summary(path: pathlib.Path, top: int) -> None:
+    """Print the functions with the highest total time (excluding sub-calls)."""
+    stats = pstats.Stats(str(path))
+    stats.strip_dirs().sort_stats(pstats.SortKey.TIME).print_stats(top)
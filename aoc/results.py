@@ -0,0 +1,170 @@
+"""Machine readable results and comparison against a baseline"""
+
+import csv
+import datetime
+import json
+import logging
+import pathlib
+import platform
+import subprocess
+import typing
+
+from .discovery import ROOT
+from .runner import Result, Status
+from .timing import Statistics
+
+
+def create_report(repeat: int, warmup: int) -> dict:
+    """Create an empty report, holding the information about this run.
+
+    Args:
+        repeat: number of timed runs per day.
+        warmup: number of untimed runs per day before the timed runs.
+    """
+    return {
+        "started": datetime.datetime.now(datetime.timezone.utc).isoformat(
+            timespec="seconds"
+        ),
+        "python": platform.python_version(),
+        "revision": git_revision(),
+        "repeat": repeat,
+        "warmup": warmup,
+        "results": [],
+    }
+
+
+def to_record(result: Result) -> dict:
+    """Convert the result of a day into a (JSON serializable) report entry."""
+    return {
+        "year": result.day.year,
+        "day": result.day.number,
+        "module": result.day.module,
+        "variant": result.day.variant,
+        "status": result.status.name,
+        "cached": result.cached,
+        "input_sha256": result.input_hash,
+        "timings": {
+            phase: Statistics(values).to_dict()
+            for phase, values in result.measurements.samples.items()
+        },
+        "memory": result.measurements.memory,
+        "calls": (
+            None
+            if result.measurements.calls is None
+            else {
+                name: {"calls": count, "seconds": duration}
+                for name, (count, duration) in result.measurements.calls.items()
+            }
+        ),
+    }
+
+
+def git_revision() -> typing.Optional[str]:
+    """Current git revision of the repository, marked dirty for uncommitted changes."""
+    try:
+        result = subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=ROOT,
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def write_results(path: pathlib.Path, report: dict) -> None:
+    """Write a report to a CSV file (based on the suffix) or a JSON file.
+
+    The CSV file contains a row per timed phase of each day, repeating the run
+    information on every row. The memory columns are empty unless traced.
+
+    Args:
+        path: output file.
+        report: run information and per day results.
+    """
+    if path.suffix.lower() != ".csv":
+        path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        return
+
+    fields = [
+        "year",
+        "day",
+        "module",
+        "phase",
+        "status",
+        "input_sha256",
+        "python",
+        "revision",
+    ]
+    fields += ["count", "min", "median", "mean", "p95", "stdev", "outliers"]
+    fields += ["peak_bytes", "retained_bytes"]
+    with path.open("w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=fields)
+        writer.writeheader()
+        for result in report["results"]:
+            for phase, timing in result["timings"].items():
+                memory = (result.get("memory") or {}).get(phase, {})
+                writer.writerow(
+                    {
+                        "year": result["year"],
+                        "day": result["day"],
+                        "module": result["module"],
+                        "phase": phase,
+                        "status": result["status"],
+                        "input_sha256": result["input_sha256"],
+                        "python": report["python"],
+                        "revision": report["revision"],
+                        **timing,
+                        "peak_bytes": memory.get("peak"),
+                        "retained_bytes": memory.get("retained"),
+                    }
+                )
+
+
+def find_regressions(
+    report: dict, baseline: dict, threshold: float
+) -> list[tuple[int, str, float, float]]:
+    """Find the days that got slower than the baseline beyond a threshold.
+
+    The median time of the complete solve step is compared for days that were
+    solved in the baseline with the same input, and not taken from the cache
+    now. A day that is no longer solved (timeout, out of memory) always counts
+    as a regression.
+
+    Args:
+        report: current results.
+        baseline: previous results, in the same format.
+        threshold: allowed relative slowdown, 0.1 for 10%.
+
+    Returns:
+        (year, module name, baseline median, current median) for every regression.
+    """
+    previous = {
+        (result["year"], result["module"]): result for result in baseline["results"]
+    }
+
+    regressions = []
+    for result in report["results"]:
+        before = previous.get((result["year"], result["module"]))
+        if result.get("cached") or before is None or before["status"] != Status.OK.name:
+            continue
+        if result["input_sha256"] != before["input_sha256"]:
+            logging.warning(
+                "%d %s: input differs from the baseline",
+                result["year"],
+                result["module"],
+            )
+            continue
+
+        old = before["timings"]["solve"]["median"]
+        new = result["timings"]["solve"]["median"]
+        if result["status"] != Status.OK.name or new > old * (1 + threshold):
+            regressions.append((result["year"], result["module"], old, new))
+    return regressions
+
+
+def percentage(text: str) -> float:
+    """Parse a percentage like "10%" (or "10") into a fraction."""
+    return float(text.rstrip("%")) / 100
@@ -0,0 +1,331 @@
+"""Solving the days, in the current process or in a pool of worker processes"""
+
+import concurrent.futures
+import dataclasses
+import enum
+import logging
+import math
+import multiprocessing
+import pathlib
+import resource
+import typing
+
+from . import counting
+from .discovery import Day, load_module
+from .memory import trace_day
+from .profiling import profile_day
+from .startup import lazy_import
+from .timing import ExecutionTimer, benchmark
+
+
+class Status(enum.Enum):
+    """Outcome of solving a single day."""
+
+    OK = 1
+    TIMEOUT = 2
+    OOM = 3
+    CRASHED = 4
+    # a variant importing an optional dependency that is not installed
+    SKIPPED = 5
+    # the input could not be fetched, the day was not solved
+    NO_INPUT = 6
+
+
+@dataclasses.dataclass
+class Options:
+    """Settings for solving a day, passed along to the worker processes.
+
+    Attributes:
+        repeat (int): number of timed runs.
+        warmup (int): number of untimed runs before the timed runs.
+        profile (str): phase to profile in an additional run, "solve" for the
+            complete solve step, None to disable profiling.
+        profile_dir (pathlib.Path): directory receiving the profile statistics.
+        memory (bool): trace the memory allocations in an additional run.
+        top (int): number of allocation sites listed per phase.
+        count_calls (bool): count the calls of the hot paths in an additional run.
+    """
+
+    repeat: int = 1
+    warmup: int = 0
+    profile: typing.Optional[str] = None
+    profile_dir: pathlib.Path = pathlib.Path("profiles")
+    memory: bool = False
+    top: int = 10
+    count_calls: bool = False
+
+    def profile_path(self: "Options", day: Day) -> pathlib.Path:
+        """File receiving the profile statistics of a day."""
+        return self.profile_dir / f"{day.year}_{day.module}.pstats"
+
+
+@dataclasses.dataclass
+class Measurements:
+    """What was measured while solving a single day.
+
+    Attributes:
+        samples (dict[str, list[float]]): execution times in seconds per phase.
+        memory (dict): memory usage per phase (see MemoryTracer.usage), None
+            unless traced.
+        calls (dict[str, tuple[int, float]]): number of calls and inclusive time
+            in seconds per hot path, None unless counted.
+        duration (float): wall-clock time in seconds spent on the day, including
+            all runs and the import, None when unknown.
+    """
+
+    samples: dict[str, list[float]]
+    memory: typing.Optional[dict] = None
+    calls: typing.Optional[dict[str, tuple[int, float]]] = None
+    duration: typing.Optional[float] = None
+
+
+@dataclasses.dataclass
+class Result:
+    """Outcome of solving a single day.
+
+    Attributes:
+        day (Day): the solved day.
+        input_hash (str): SHA-256 of the puzzle input.
+        status (Status): whether the day was solved.
+        solution (tuple[str, str]): answers of both parts, None unless solved.
+        measurements (Measurements): execution times, memory usage and calls.
+        cached (bool): taken from the result cache, the samples are those of the
+            run that solved the day.
+    """
+
+    day: Day
+    input_hash: str
+    status: Status
+    solution: typing.Optional[tuple[str, str]]
+    measurements: Measurements
+    cached: bool = False
+
+
+@dataclasses.dataclass
+class PoolOptions:
+    """Settings for solving the days in a pool of worker processes.
+
+    Attributes:
+        jobs (int): number of worker processes.
+        timeout (float): wall-clock limit per day in seconds, None for no limit.
+        memory_limit (int): address space limit per worker in bytes, None for no
+            limit.
+        durations (dict[tuple[int, str], float]): expected duration in seconds by
+            year and module, for example from the history, None to submit the
+            days in order.
+        isolate (bool): solve every day in a fresh interpreter.
+    """
+
+    jobs: int = 1
+    timeout: typing.Optional[float] = None
+    memory_limit: typing.Optional[int] = None
+    durations: typing.Optional[dict[tuple[int, str], float]] = None
+    isolate: bool = False
+
+
+def solve_day(
+    day: Day, data: str, options: Options
+) -> tuple[Status, typing.Optional[tuple[str, str]], Measurements]:
+    """Import a day module and time its solve step.
+
+    This is executed inside a worker process when running in a pool, so the
+    measured durations only cover the solve step of that specific day. Profiling,
+    tracing memory and counting calls each take an additional run following the
+    timed runs, so they do not affect the timings.
+
+    The time to import the day module is included as the "import" phase. The
+    answers are converted to strings, so they can be returned from a worker
+    process without importing the days package of the year in the main process.
+
+    A day running out of memory is reported as OOM, including the time up to that
+    point. A day raising any other exception is logged and reported as CRASHED, a
+    variant failing to import a module (an optional dependency like numpy) as
+    SKIPPED.
+
+    Args:
+        day: day to solve.
+        data: puzzle input.
+        options: how to solve the day.
+
+    Returns:
+        The status, the solution (None unless solved) and the measurements of
+        the day.
+    """
+    with ExecutionTimer() as total:
+        status = Status.OK
+        solution = None
+        samples = {}
+        memory = None
+        calls = None
+        try:
+            with ExecutionTimer() as timer:
+                module = load_module(day.year, day.module)
+            samples["import"] = [timer.duration]
+            solution = tuple(
+                str(answer)
+                for answer in benchmark(
+                    module, data, samples, options.repeat, options.warmup
+                )
+            )
+            if options.profile is not None:
+                profile_day(module, data, options.profile, options.profile_path(day))
+            if options.memory:
+                memory = trace_day(module, data, options.top)
+            if options.count_calls:
+                calls = counting.count_calls(module, data)
+        except MemoryError:
+            status = Status.OOM
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            if (
+                isinstance(error, ModuleNotFoundError)
+                and day.variant is not None
+                and "import" not in samples
+            ):
+                logging.warning("%d %s skipped: %s", day.year, day.module, error)
+                status = Status.SKIPPED
+            else:
+                logging.exception(
+                    "%d day %d (%s) crashed", day.year, day.number, day.module
+                )
+                status = Status.CRASHED
+        # a day failing before its first timed run still reports a solve time
+        samples.setdefault("solve", [0.0])
+    return status, solution, Measurements(samples, memory, calls, total.duration)
+
+
+def limit_memory(limit: typing.Optional[int]) -> None:
+    """Cap the address space of a worker process.
+
+    Allocations beyond the limit raise a MemoryError inside the worker.
+
+    Args:
+        limit: maximum address space in bytes, None for no limit.
+    """
+    if limit is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def load_day(
+    load: typing.Callable[[int, int], tuple[str, str]], day: Day
+) -> tuple[typing.Optional[str], str]:
+    """Provide the input of a day, logging the failure when it is not available.
+
+    Returns:
+        The input and its SHA-256, or None and an empty hash when loading the input
+        failed, for example when fetching it gave up with urllib.error.URLError.
+    """
+    try:
+        return load(day.year, day.number)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        logging.error("%d day %d: no input: %s", day.year, day.number, error)
+        return None, ""
+
+
+def run_sequential(
+    load: typing.Callable[[int, int], tuple[str, str]],
+    days: list[Day],
+    options: Options,
+) -> typing.Generator[Result, None, None]:
+    """Solve the days one after another in the current process.
+
+    A day without an input is reported as NO_INPUT and the run continues.
+
+    Args:
+        load: provides the input and its SHA-256 for a year and day.
+        days: days to solve.
+        options: how to solve each day.
+    """
+    for day in days:
+        data, digest = load_day(load, day)
+        if data is None:
+            yield Result(
+                day, digest, Status.NO_INPUT, None, Measurements({"solve": [0.0]})
+            )
+        else:
+            yield Result(day, digest, *solve_day(day, data, options))
+
+
+def run_pool(
+    load: typing.Callable[[int, int], tuple[str, str]],
+    days: list[Day],
+    options: Options,
+    pool: PoolOptions,
+) -> typing.Generator[Result, None, None]:
+    """Solve the days in a pool of worker processes, yielding the results in order.
+
+    Inputs are fetched in the main process and each day is submitted as soon as
+    its input is available, so fetching overlaps with solving earlier days. A day
+    exceeding the timeout, which covers all its runs, is terminated and reported
+    as TIMEOUT, the pool replaces the worker and continues with the next day. A day
+    without an input is not submitted and reported as NO_INPUT.
+
+    With the expected durations, the days are submitted longest first (LPT
+    scheduling), days without a known duration before all others, so a slow day
+    does not start last while the other workers are idle.
+
+    Isolated days each run in a fresh interpreter: the workers are started with
+    spawn rather than fork and replaced after every day. Caches, the heap and the
+    garbage collector generations then start out the same for every day, no
+    matter which days ran before.
+
+    Args:
+        load: provides the input and its SHA-256 for a year and day.
+        days: days to solve.
+        options: how to solve each day.
+        pool: how to spread the days over the workers.
+    """
+    pebble = lazy_import("pebble")
+    order = days
+    durations = pool.durations
+    if durations is not None:
+        order = sorted(
+            days,
+            key=lambda day: -durations.get((day.year, day.module), math.inf),
+        )
+    with pebble.ProcessPool(
+        max_workers=pool.jobs,
+        max_tasks=1 if pool.isolate else 0,
+        initializer=limit_memory,
+        initargs=(pool.memory_limit,),
+        context=multiprocessing.get_context("spawn" if pool.isolate else None),
+    ) as workers:
+        futures = {}
+        for day in order:
+            data, digest = load_day(load, day)
+            future = None
+            if data is not None:
+                future = workers.schedule(
+                    solve_day, args=(day, data, options), timeout=pool.timeout
+                )
+            futures[day.year, day.module] = (digest, future)
+
+        for day in days:
+            digest, future = futures[day.year, day.module]
+            if future is None:
+                yield Result(
+                    day, digest, Status.NO_INPUT, None, Measurements({"solve": [0.0]})
+                )
+                continue
+            try:
+                result = Result(day, digest, *future.result())
+            except concurrent.futures.TimeoutError:
+                result = Result(
+                    day,
+                    digest,
+                    Status.TIMEOUT,
+                    None,
+                    Measurements({"solve": [pool.timeout]}, duration=pool.timeout),
+                )
+            except pebble.ProcessExpired as error:
+                logging.error("%d day %d: %s", day.year, day.number, error)
+                result = Result(
+                    day, digest, Status.CRASHED, None, Measurements({"solve": [0.0]})
+                )
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                # raised outside the day, for example returning the result from a
+                # worker at its memory limit
+                logging.error("%d day %d: %r", day.year, day.number, error)
+                result = Result(
+                    day, digest, Status.CRASHED, None, Measurements({"solve": [0.0]})
+                )
+            yield result
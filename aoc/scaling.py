@@ -0,0 +1,154 @@
+"""Empirical complexity: solving a day on growing generated inputs and fitting the growth"""
+
+import csv
+import dataclasses
+import logging
+import math
+import pathlib
+import statistics
+import typing
+
+from .discovery import Day, load_module
+from .generators import generate_input
+from .timing import Statistics, benchmark
+
+COMPLEXITIES = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": math.log,
+    "O(n)": float,
+    "O(n log n)": lambda n: n * math.log(n),
+    "O(n^2)": lambda n: float(n) ** 2,
+    "O(n^2 log n)": lambda n: float(n) ** 2 * math.log(n),
+    "O(n^3)": lambda n: float(n) ** 3,
+}
+
+
+def geometric_sizes(start: int, stop: int, steps: int) -> list[int]:
+    """Sizes from start to stop (both included) growing by a constant factor."""
+    if steps < 2 or start == stop:
+        return [start]
+    factor = (stop / start) ** (1 / (steps - 1))
+    return sorted({round(start * factor**step) for step in range(steps)})
+
+
+@dataclasses.dataclass
+class ScalingOptions:
+    """Settings for timing a day on growing generated inputs.
+
+    Attributes:
+        phase (str): the timed phase, "solve" for the complete solve step.
+        seed (int): seed for generating the inputs.
+        repeat (int): number of timed runs per size.
+        limit (float): skip the larger sizes once the median exceeds this many
+            seconds, None for no limit.
+    """
+
+    phase: str = "solve"
+    seed: int = 0
+    repeat: int = 3
+    limit: typing.Optional[float] = None
+
+
+def measure(
+    day: Day, sizes: list[int], options: ScalingOptions
+) -> list[tuple[int, Statistics]]:
+    """Time a day, or a single phase, on generated inputs of increasing size.
+
+    Args:
+        day: day to solve.
+        sizes: input sizes, in ascending order.
+        options: how to time the day.
+
+    Returns:
+        (size, statistics of the phase) for every measured size.
+    """
+    module = load_module(day.year, day.module)
+    measurements = []
+    for size in sizes:
+        data, _ = generate_input(day.year, day.number, size, options.seed)
+        samples = {}
+        benchmark(module, data, samples, options.repeat)
+        if options.phase not in samples:
+            raise ValueError(f"{day.module} has no separate {options.phase} phase")
+
+        summary = Statistics(samples[options.phase])
+        measurements.append((size, summary))
+        logging.info("Size %d: %.6fs", size, summary.median)
+        if options.limit is not None and summary.median > options.limit:
+            logging.info(
+                "Skipping the sizes beyond %d, exceeding %ss", size, options.limit
+            )
+            break
+    return measurements
+
+
+def fit(sizes: list[int], times: list[float]) -> list[tuple[str, float, float, float]]:
+    """Fit the times to every complexity: time = overhead + factor * f(size).
+
+    The fit minimizes the relative error, so the small sizes count as much as the
+    large ones, and the overhead is not allowed to be negative.
+
+    Returns:
+        (complexity, overhead, factor, relative RMS error) for every complexity
+        with a positive factor, best fit first. A complexity that is zero for
+        every size, like O(log n) when only size 1 is measured, is left out.
+    """
+    weights = [1 / max(time, 1e-12) ** 2 for time in times]
+    fits = []
+    for name, function in COMPLEXITIES.items():
+        values = [function(size) for size in sizes]
+        total = sum(weights)
+        sum_f = sum(w * f for w, f in zip(weights, values))
+        sum_ff = sum(w * f * f for w, f in zip(weights, values))
+        sum_t = sum(w * t for w, t in zip(weights, times))
+        sum_ft = sum(w * f * t for w, f, t in zip(weights, values, times))
+        if sum_ff == 0:
+            continue
+
+        determinant = total * sum_ff - sum_f**2
+        if name == "O(1)" or determinant <= 1e-12 * total * sum_ff:
+            overhead, factor = 0.0, sum_ft / sum_ff
+        else:
+            factor = (total * sum_ft - sum_f * sum_t) / determinant
+            overhead = (sum_ff * sum_t - sum_f * sum_ft) / determinant
+            if overhead < 0:
+                overhead, factor = 0.0, sum_ft / sum_ff
+        if factor <= 0:
+            continue
+
+        error = math.sqrt(
+            sum(
+                w * (t - overhead - factor * f) ** 2
+                for w, f, t in zip(weights, values, times)
+            )
+            / len(times)
+        )
+        fits.append((name, overhead, factor, error))
+    return sorted(fits, key=lambda item: item[3])
+
+
+def exponent(sizes: list[int], times: list[float]) -> typing.Optional[float]:
+    """Slope of log(time) against log(size), about k for O(n^k)."""
+    if len(set(sizes)) < 2:
+        return None
+    return statistics.linear_regression(
+        [math.log(size) for size in sizes], [math.log(time) for time in times]
+    ).slope
+
+
+def write_csv(
+    path: pathlib.Path,
+    measurements: list[tuple[int, Statistics]],
+    fits: list[tuple[str, float, float, float]],
+) -> None:
+    """Write the measurements with the time predicted by every fit, one row per size."""
+    fields = ["size", "count", "min", "median", "mean", "p95", "stdev", "outliers"]
+    fields += [name for name, _, _, _ in fits]
+    with path.open("w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=fields)
+        writer.writeheader()
+        for size, summary in measurements:
+            row = {"size": size, **summary.to_dict()}
+            for name, overhead, factor, _ in fits:
+                row[name] = overhead + factor * COMPLEXITIES[name](size)
+            writer.writerow(row)
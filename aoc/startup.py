@@ -0,0 +1,39 @@
+"""Startup costs of the runner: interpreter startup and (lazy) imports"""
+
+import importlib
+import sys
+import time
+import types
+
+from . import STARTUP_TIME
+from .timing import ExecutionTimer
+
+# Duration in seconds of the imports done through lazy_import
+import_times = {}
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Import a module on first use, recording how long the import took.
+
+    Args:
+        name: absolute name of the module.
+
+    Returns:
+        The imported module.
+    """
+    if name not in sys.modules:
+        with ExecutionTimer() as timer:
+            importlib.import_module(name)
+        import_times[name] = timer.duration
+    return sys.modules[name]
+
+
+def startup_times() -> dict[str, float]:
+    """CPU time in seconds spent on starting the interpreter and importing the runner.
+
+    Both are process times, as the interpreter startup has no wall-clock reference.
+    """
+    return {
+        "interpreter": STARTUP_TIME,
+        "runner imports": time.process_time() - STARTUP_TIME,
+    }
@@ -0,0 +1,288 @@
+"""Timing of the solve step of a day"""
+
+import ast
+import contextlib
+import functools
+import gc
+import inspect
+import statistics
+import textwrap
+import time
+import types
+import typing
+
+PHASES = {"parse": "parse", "part1": "part 1", "part2": "part 2"}
+
+
+class ExecutionTimer(contextlib.AbstractContextManager):
+    """High resolution timer to capture the execution time of a block.
+
+    Attributes:
+        duration (float): elapsed time in seconds.
+        duration_ns (int): elapsed time in whole nanoseconds.
+        duration_ms (float): elapsed time in milliseconds.
+    """
+
+    def __init__(self: "ExecutionTimer") -> None:
+        """Initialize ExecutionTimer."""
+        self._start = 0
+        self.duration = 0.0
+        self.duration_ms = 0.0
+        self.duration_ns = 0
+
+    def __enter__(self: "ExecutionTimer") -> "ExecutionTimer":
+        """Start the timed context by recording the current time.
+
+        Returns:
+            The timed context.
+        """
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(
+        self: "ExecutionTimer",
+        exc_type: typing.Optional[typing.Type[BaseException]],
+        exc_value: typing.Optional[BaseException],
+        exc_traceback: typing.Optional[types.TracebackType],
+    ) -> typing.Literal[False]:
+        """Stop the timed context and calculate the elapsed time.
+
+        Args:
+            exc_type: optional exception type
+            exc_value: optional exception value
+            exc_traceback: optional exception traceback
+
+        Returns:
+            False, any captured exception will be propagated.
+        """
+        stop = time.perf_counter_ns()
+        self.duration_ns = stop - self._start
+        self.duration_ms = self.duration_ns * 1e-6
+        self.duration = self.duration_ns * 1e-9
+        return False
+
+
+class Statistics:
+    """Summary of repeated execution time samples.
+
+    Outliers are detected with Tukey's fences, any sample further than 1.5 times
+    the interquartile range outside the quartiles. The mean and the standard
+    deviation exclude outliers, all other statistics are based on every sample.
+
+    Attributes:
+        count (int): number of samples.
+        minimum (float): fastest sample in seconds.
+        median (float): median sample in seconds.
+        mean (float): mean of the samples, excluding outliers, in seconds.
+        p95 (float): 95th percentile in seconds.
+        stdev (float): standard deviation, excluding outliers, in seconds.
+        outliers (int): number of outliers.
+    """
+
+    def __init__(self: "Statistics", samples: list[float]) -> None:
+        """Initialize Statistics.
+
+        Args:
+            samples: execution times in seconds, at least one.
+        """
+        ordered = sorted(samples)
+        self.count = len(ordered)
+        self.minimum = ordered[0]
+        self.median = statistics.median(ordered)
+
+        if self.count > 1:
+            q1, _, q3 = statistics.quantiles(ordered, n=4, method="inclusive")
+            self.p95 = statistics.quantiles(ordered, n=20, method="inclusive")[-1]
+        else:
+            q1 = q3 = self.p95 = ordered[0]
+
+        fence = 1.5 * (q3 - q1)
+        inliers = [x for x in ordered if q1 - fence <= x <= q3 + fence]
+        self.outliers = self.count - len(inliers)
+        self.mean = statistics.fmean(inliers)
+        self.stdev = statistics.stdev(inliers) if len(inliers) > 1 else 0.0
+
+    def to_dict(self: "Statistics") -> dict[str, float]:
+        """Convert the statistics into a (JSON serializable) dictionary."""
+        return {
+            "count": self.count,
+            "min": self.minimum,
+            "median": self.median,
+            "mean": self.mean,
+            "p95": self.p95,
+            "stdev": self.stdev,
+            "outliers": self.outliers,
+        }
+
+    def __str__(self: "Statistics") -> str:
+        return (
+            f"min: {self.minimum:.6}s, median: {self.median:.6}s, mean: {self.mean:.6}s, "
+            f"p95: {self.p95:.6}s, stdev: {self.stdev:.6}s, outliers: {self.outliers}/{self.count}"
+        )
+
+
+def reset_caches(module: types.ModuleType) -> None:
+    """Clear the functools caches of a module, so every run performs the same work.
+
+    Args:
+        module: day module.
+    """
+    for value in vars(module).values():
+        if callable(getattr(value, "cache_clear", None)):
+            value.cache_clear()
+
+
+def is_call(node: ast.AST, function: str, argument: str) -> bool:
+    """Check whether a node calls a function by name with a single named argument."""
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == function
+        and len(node.args) == 1
+        and not node.keywords
+        and isinstance(node.args[0], ast.Name)
+        and node.args[0].id == argument
+    )
+
+
+def has_phases(module: types.ModuleType) -> bool:
+    """Check whether a day module follows the parse, part 1 and part 2 structure.
+
+    The solve step must be exactly `return (_part1(parsed), _part2(parsed))`,
+    where parsed is the input or `parsed = _parse(input)`, so timing the phases
+    separately gives the answers of solve. Modules doing anything else, like
+    post-processing an answer or passing a different argument to _part2, are
+    timed as a whole.
+
+    Args:
+        module: day module.
+
+    Returns:
+        True when the phases can be timed separately.
+    """
+    if not all(
+        callable(getattr(module, f"_{phase}", None)) for phase in ("part1", "part2")
+    ):
+        return False
+    try:
+        source = textwrap.dedent(inspect.getsource(module.solve))
+    except (OSError, TypeError):
+        return False
+    function = ast.parse(source).body[0]
+    body = function.body
+    if (
+        body
+        and isinstance(body[0], ast.Expr)
+        and isinstance(body[0].value, ast.Constant)
+    ):
+        body = body[1:]
+    if not function.args.args or not body:
+        return False
+
+    argument = function.args.args[0].arg
+    if len(body) == 2:
+        parse = body[0]
+        if not (
+            isinstance(parse, ast.Assign)
+            and len(parse.targets) == 1
+            and isinstance(parse.targets[0], ast.Name)
+            and is_call(parse.value, "_parse", argument)
+            and callable(getattr(module, "_parse", None))
+        ):
+            return False
+        argument = parse.targets[0].id
+    elif len(body) != 1:
+        return False
+
+    result = body[-1]
+    return (
+        isinstance(result, ast.Return)
+        and isinstance(result.value, ast.Tuple)
+        and len(result.value.elts) == 2
+        and is_call(result.value.elts[0], "_part1", argument)
+        and is_call(result.value.elts[1], "_part2", argument)
+    )
+
+
+@contextlib.contextmanager
+def record(
+    samples: dict[str, list[float]], phase: str
+) -> typing.Generator[None, None, None]:
+    """Time a block and add the duration to the samples of a phase.
+
+    The duration is recorded even when the block is interrupted by an exception.
+
+    Args:
+        samples: execution times in seconds per phase.
+        phase: name of the timed phase.
+    """
+    timer = ExecutionTimer()
+    try:
+        with timer:
+            yield
+    finally:
+        samples.setdefault(phase, []).append(timer.duration)
+
+
+def run_once(
+    module: types.ModuleType,
+    data: str,
+    measure: typing.Callable[[str], typing.ContextManager],
+) -> tuple[int, int]:
+    """Solve a day once, measuring the complete solve step and, when the module
+    follows that structure, the parse, part 1 and part 2 phases separately.
+
+    Args:
+        module: day module.
+        data: puzzle input.
+        measure: creates the context wrapping a phase, given the name of the
+            phase: "solve" for the complete solve step, "parse", "part1" or "part2".
+
+    Returns:
+        The solution.
+    """
+    if not has_phases(module):
+        with measure("solve"):
+            return module.solve(data)
+
+    with measure("solve"):
+        parsed_input = data
+        if "_parse" in module.solve.__code__.co_names:
+            with measure("parse"):
+                parsed_input = getattr(module, "_parse")(data)
+        with measure("part1"):
+            part1 = getattr(module, "_part1")(parsed_input)
+        with measure("part2"):
+            part2 = getattr(module, "_part2")(parsed_input)
+    return (part1, part2)
+
+
+def benchmark(
+    module: types.ModuleType,
+    data: str,
+    samples: dict[str, list[float]],
+    repeat: int = 1,
+    warmup: int = 0,
+) -> tuple[int, int]:
+    """Run the solve step of a day repeatedly and time every run.
+
+    Args:
+        module: day module.
+        data: puzzle input.
+        samples: receives the execution time in seconds of each timed run, per
+            phase, including a run that is interrupted by an exception.
+        repeat: number of timed runs.
+        warmup: number of untimed runs before the timed runs.
+
+    Returns:
+        The solution of the last run.
+    """
+    for _ in range(warmup):
+        reset_caches(module)
+        module.solve(data)
+
+    for _ in range(repeat):
+        reset_caches(module)
+        gc.collect()
+        solution = run_once(module, data, functools.partial(record, samples))
+    return solution
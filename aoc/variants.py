@@ -0,0 +1,53 @@
+"""Comparing the variants of a day: alternative implementations solving the same input"""
+
+import statistics
+
+from .runner import Result, Status
+
+
+def group_variants(results: list[Result]) -> list[list[Result]]:
+    """Group the results of the days solved by more than one module.
+
+    Args:
+        results: results ordered by year and day, as yielded by the runner.
+
+    Returns:
+        The results of every day with variants, the canonical module first.
+    """
+    groups = {}
+    for result in results:
+        groups.setdefault((result.day.year, result.day.number), []).append(result)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def differing_answers(group: list[Result]) -> list[Result]:
+    """Find the variants answering differently from the reference.
+
+    The reference is the first solved module of the group, normally the canonical
+    module. Variants that were not solved (timeout, out of memory) are not compared.
+
+    Args:
+        group: results of the modules of a single day.
+
+    Returns:
+        The solved variants with different answers.
+    """
+    solved = [result for result in group if result.status == Status.OK]
+    return [result for result in solved[1:] if result.solution != solved[0].solution]
+
+
+def speedups(group: list[Result]) -> list[float]:
+    """Speedup of every module compared to the slowest one, by median solve time.
+
+    Modules that were not solved get a speedup of 0.
+    """
+    medians = [
+        (
+            statistics.median(result.measurements.samples["solve"])
+            if result.status == Status.OK
+            else 0
+        )
+        for result in group
+    ]
+    slowest = max(medians)
+    return [slowest / median if median else 0.0 for median in medians]
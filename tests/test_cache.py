@@ -0,0 +1,45 @@
+"""Tests of the cache of solved days"""
+
+import json
+
+from aoc import cache
+from aoc.cache import ResultCache
+from aoc.discovery import Day
+from aoc.runner import Measurements, Result, Status
+
+
+def make_day(root):
+    """Create a day module of a fake year."""
+    path = root / "1999" / "days"
+    path.mkdir(parents=True)
+    (path / "day_01.py").write_text("def solve(data):\n    pass\n", encoding="utf-8")
+    return Day(1999, 1, "day_01")
+
+
+def test_cached_answers_match_the_solved_answers(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "ROOT", tmp_path)
+    day = make_day(tmp_path)
+    solved = Result(
+        day,
+        "abc",
+        Status.OK,
+        ("<Point x: 9, y: 4>", "3"),
+        Measurements({"solve": [1.0]}),
+    )
+
+    ResultCache(tmp_path / "cache.json").put([solved])
+    cached = ResultCache(tmp_path / "cache.json").get(day, "abc")
+
+    assert cached.cached
+    assert cached.solution == solved.solution
+
+
+def test_entries_with_answers_other_than_strings_are_ignored(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "ROOT", tmp_path)
+    day = make_day(tmp_path)
+    path = tmp_path / "cache.json"
+    key = ResultCache(path).key(day, "abc")
+    entry = {"year": 1999, "module": "day_01", "solution": [[9, 4], 3], "samples": {}}
+    path.write_text(json.dumps({key: entry}), encoding="utf-8")
+
+    assert ResultCache(path).get(day, "abc") is None
@@ -0,0 +1,11 @@
+"""Tests of formatting the outcome of a run"""
+
+from aoc.cli import format_schedule
+
+
+def test_format_schedule_reports_the_ideal_time():
+    assert format_schedule([1.0, 3.0], 2, 4.0).endswith("ideal: 3.0s")
+
+
+def test_format_schedule_without_durations():
+    assert format_schedule([], 2, 1.0).endswith("ideal: 0.0s")
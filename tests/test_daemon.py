@@ -0,0 +1,28 @@
+"""Tests of the resident solver daemon"""
+
+import json
+import socket
+import socketserver
+import threading
+
+from aoc.daemon import RequestHandler, SolverDaemon
+from aoc.inputs import InputStore
+
+
+def test_malformed_request_gets_an_error_reply(tmp_path):
+    path = tmp_path / "daemon.sock"
+    handler = type(
+        "Handler",
+        (RequestHandler,),
+        {"solver": SolverDaemon(InputStore(tmp_path / "store"))},
+    )
+    with socketserver.UnixStreamServer(str(path), handler) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(str(path))
+            connection.sendall(b"{not json\n")
+            response = json.loads(connection.makefile("rb").readline())
+        server.shutdown()
+
+    assert "JSONDecodeError" in response["error"]
@@ -0,0 +1,17 @@
+"""Tests of the input generators"""
+
+import pytest
+
+from aoc.discovery import load_module
+from aoc.generators import generate_input
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_claw_machines_are_not_won_with_negative_presses(seed):
+    day = load_module(2024, "day_13")
+    data, _ = generate_input(2024, 13, 200, seed)
+
+    for machine in data.split("\n\n"):
+        part1, part2 = day.solve(machine)
+        assert part1 >= 0
+        assert part2 >= 0
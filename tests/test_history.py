@@ -0,0 +1,88 @@
+"""Tests of the benchmark history"""
+
+from aoc.history import find_trends, store_report
+
+
+def store_run(path, revision, medians, status="OK", input_sha256="abc"):
+    """Append a run solving day_NN modules of 2024 in the given median times."""
+    timing = {"count": 1, "min": 0.0, "mean": 0.0, "p95": 0.0, "stdev": 0.0}
+    store_report(
+        path,
+        {
+            "started": f"2024-12-01T00:00:{revision}",
+            "revision": revision,
+            "python": "3.12",
+            "repeat": 1,
+            "warmup": 0,
+            "results": [
+                {
+                    "year": 2024,
+                    "day": int(module[-2:]),
+                    "module": module,
+                    "status": status,
+                    "input_sha256": input_sha256,
+                    "timings": {"solve": {**timing, "median": median}},
+                }
+                for module, median in medians.items()
+            ],
+        },
+    )
+
+
+def test_slowdown_above_the_threshold_is_a_regression(tmp_path):
+    path = tmp_path / "history.sqlite"
+    store_run(path, "01", {"day_01": 1.0})
+    store_run(path, "02", {"day_01": 1.5})
+    store_run(path, "03", {"day_01": 1.4})
+
+    trend = find_trends(path, threshold=0.1)[0]
+
+    assert trend.fastest[:2] == (1.0, "01")
+    assert trend.latest[:2] == (1.4, "03")
+    assert trend.change == 1.4 / 1.0 - 1
+    assert trend.regression[0] == "02"
+
+
+def test_noise_below_the_threshold_is_not_a_regression(tmp_path):
+    path = tmp_path / "history.sqlite"
+    store_run(path, "01", {"day_01": 1.0})
+    store_run(path, "02", {"day_01": 1.3})
+    store_run(path, "03", {"day_01": 1.05})
+
+    trend = find_trends(path, threshold=0.1)[0]
+
+    assert trend.regression is None
+
+
+def test_day_missing_from_a_run(tmp_path):
+    path = tmp_path / "history.sqlite"
+    store_run(path, "01", {"day_01": 1.0, "day_02": 1.0})
+    store_run(path, "02", {"day_01": 1.0})
+    store_run(path, "03", {"day_02": 2.0, "day_03": 1.0})
+
+    trends = {trend.module: trend for trend in find_trends(path, threshold=0.1)}
+
+    assert trends["day_01"].regression is None
+    assert trends["day_02"].regression[0] == "03"
+    assert trends["day_03"].regression is None
+
+
+def test_only_runs_on_the_latest_input_are_compared(tmp_path):
+    path = tmp_path / "history.sqlite"
+    store_run(path, "01", {"day_01": 1.0})
+    store_run(path, "02", {"day_01": 2.0}, input_sha256="def")
+
+    trend = find_trends(path, threshold=0.1)[0]
+
+    assert trend.fastest[:2] == (2.0, "02")
+    assert trend.regression is None
+
+
+def test_unsolved_latest_run_is_a_regression(tmp_path):
+    path = tmp_path / "history.sqlite"
+    store_run(path, "01", {"day_01": 1.0})
+    store_run(path, "02", {"day_01": 0.5}, status="TIMEOUT")
+
+    trend = find_trends(path, threshold=0.1)[0]
+
+    assert trend.regression[0] == "02"
@@ -0,0 +1,15 @@
+"""Tests of the local store of puzzle inputs"""
+
+from aoc.inputs import InputStore
+
+
+def test_stored_inputs_are_read_as_written(tmp_path):
+    store = InputStore(tmp_path)
+    digest = store.put(2024, 1, "1 2\r\n3 4")
+    store.put(2024, 2, "")
+
+    reopened = InputStore(tmp_path)
+    assert reopened.get(2024, 1) == "1 2\r\n3 4"
+    assert reopened.get(2024, 2) == ""
+    assert reopened.get(2024, 3) is None
+    assert reopened.digest(2024, 1) == digest
@@ -0,0 +1,52 @@
+"""Tests of prefetching the missing inputs"""
+
+import http.server
+import threading
+
+import pytest
+
+from aoc import prefetch
+from aoc.inputs import InputStore
+from aoc.inputserver import InputRequestHandler
+from aoc.prefetch import FetchOptions, Prefetcher
+
+
+@pytest.fixture(name="input_url")
+def fixture_input_url(tmp_path):
+    """Serve the inputs of 2024 day 1 and 2 on a local port."""
+    directory = tmp_path / "served"
+    directory.mkdir()
+    for day in (1, 2):
+        (directory / f"2024_{day:02}_input.txt").write_text(
+            f"input {day}", encoding="utf-8"
+        )
+    handler = type("Handler", (InputRequestHandler,), {"directory": directory})
+    with http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}/"
+        server.shutdown()
+
+
+def test_prefetch_stores_the_missing_inputs(tmp_path, monkeypatch, input_url):
+    monkeypatch.setattr(prefetch, "AOCD_DIR", tmp_path / "aocd")
+    monkeypatch.setenv("AOC_SESSION", "token")
+    store = InputStore(tmp_path / "store")
+
+    prefetcher = Prefetcher(store, [(2024, 1), (2024, 2)], FetchOptions(input_url))
+    prefetcher.start()
+
+    assert prefetcher.load(2024, 2)[0] == "input 2"
+    assert prefetcher.load(2024, 1)[0] == "input 1"
+
+
+def test_prefetch_reports_a_missing_input(tmp_path, monkeypatch, input_url):
+    monkeypatch.setattr(prefetch, "AOCD_DIR", tmp_path / "aocd")
+    monkeypatch.setenv("AOC_SESSION", "token")
+    store = InputStore(tmp_path / "store")
+
+    prefetcher = Prefetcher(store, [(2024, 3)], FetchOptions(input_url, retries=0))
+    prefetcher.start()
+
+    with pytest.raises(OSError):
+        prefetcher.load(2024, 3)
@@ -0,0 +1,56 @@
+"""Tests of comparing the results of a run against a baseline"""
+
+from aoc.results import find_regressions
+
+
+def make_report(medians, status="OK", input_sha256="abc"):
+    """Report of a run solving day_NN modules of 2024 in the given median times."""
+    return {
+        "results": [
+            {
+                "year": 2024,
+                "module": module,
+                "status": status,
+                "cached": False,
+                "input_sha256": input_sha256,
+                "timings": {"solve": {"median": median}},
+            }
+            for module, median in medians.items()
+        ]
+    }
+
+
+def test_slowdown_above_the_threshold_is_a_regression():
+    baseline = make_report({"day_01": 1.0, "day_02": 1.0})
+    report = make_report({"day_01": 1.2, "day_02": 1.0})
+
+    assert find_regressions(report, baseline, 0.1) == [(2024, "day_01", 1.0, 1.2)]
+
+
+def test_noise_below_the_threshold_is_not_a_regression():
+    baseline = make_report({"day_01": 1.0})
+    report = make_report({"day_01": 1.05})
+
+    assert not find_regressions(report, baseline, 0.1)
+
+
+def test_days_missing_from_either_side_are_skipped():
+    baseline = make_report({"day_01": 1.0, "day_02": 1.0})
+    report = make_report({"day_01": 1.0, "day_03": 5.0})
+
+    assert not find_regressions(report, baseline, 0.1)
+    assert not find_regressions(baseline, report, 0.1)
+
+
+def test_day_no_longer_solved_is_a_regression():
+    baseline = make_report({"day_01": 1.0})
+    report = make_report({"day_01": 0.5}, status="TIMEOUT")
+
+    assert find_regressions(report, baseline, 0.1) == [(2024, "day_01", 1.0, 0.5)]
+
+
+def test_days_on_a_different_input_are_not_compared():
+    baseline = make_report({"day_01": 1.0})
+    report = make_report({"day_01": 2.0}, input_sha256="def")
+
+    assert not find_regressions(report, baseline, 0.1)
@@ -0,0 +1,62 @@
+"""Tests of solving the days in the current process and in a pool of workers"""
+
+import textwrap
+
+from aoc import discovery
+from aoc.discovery import Day
+from aoc.runner import Options, PoolOptions, Status, run_pool, run_sequential
+
+UTILITIES = """
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __repr__(self):
+        return f"<Point x: {self.x}, y: {self.y}>"
+"""
+
+DAY = """
+from .utilities import Point
+
+
+def solve(input_data):
+    return (Point(len(input_data), 2), len(input_data))
+"""
+
+
+def make_year(root, year):
+    """Create a days package for a year whose day 1 answers with a Point."""
+    path = root / str(year) / "days"
+    path.mkdir(parents=True)
+    (path / "__init__.py").write_text("", encoding="utf-8")
+    (path / "utilities.py").write_text(textwrap.dedent(UTILITIES), encoding="utf-8")
+    (path / "day_01.py").write_text(textwrap.dedent(DAY), encoding="utf-8")
+    return [Day(year, 1, "day_01")]
+
+
+def load(year, number):
+    """Provide the same input for every day."""
+    return "abc", f"{year}-{number}"
+
+
+def test_sequential_answers_are_strings(tmp_path, monkeypatch):
+    monkeypatch.setattr(discovery, "ROOT", tmp_path)
+    days = make_year(tmp_path, 1998)
+
+    (result,) = run_sequential(load, days, Options())
+
+    assert result.status == Status.OK
+    assert result.solution == ("<Point x: 3, y: 2>", "3")
+
+
+def test_pool_returns_answers_of_the_days_package(tmp_path, monkeypatch):
+    # the days package is only imported in the worker, the answer must not
+    # require it to be imported in the main process
+    monkeypatch.setattr(discovery, "ROOT", tmp_path)
+    days = make_year(tmp_path, 1999)
+
+    (result,) = run_pool(load, days, Options(), PoolOptions(timeout=30))
+
+    assert result.status == Status.OK
+    assert result.solution == ("<Point x: 3, y: 2>", "3")
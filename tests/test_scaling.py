@@ -0,0 +1,17 @@
+"""Tests of fitting the growth of the execution time"""
+
+from aoc.scaling import fit
+
+
+def test_fit_finds_the_growth():
+    sizes = [10, 100, 1000]
+    times = [0.001 * size**2 for size in sizes]
+
+    assert fit(sizes, times)[0][0] == "O(n^2)"
+
+
+def test_fit_skips_complexities_vanishing_on_every_size():
+    names = [name for name, _, _, _ in fit([1], [0.5])]
+
+    assert "O(log n)" not in names
+    assert "O(1)" in names
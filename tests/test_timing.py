@@ -0,0 +1,96 @@
+"""Tests of timing the phases of a day"""
+
+import importlib.util
+import textwrap
+
+import pytest
+
+from aoc.timing import has_phases
+
+PHASES = """
+def _parse(data):
+    return data.split()
+
+
+def _part1(parsed):
+    return len(parsed)
+
+
+def _part2(parsed):
+    return len(parsed) * 2
+"""
+
+
+def load_source(tmp_path, source):
+    """Import a day module with the phases and the given solve step."""
+    path = tmp_path / "day.py"
+    path.write_text(PHASES + textwrap.dedent(source), encoding="utf-8")
+    spec = importlib.util.spec_from_file_location("day", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        """
+        def solve(data):
+            return (_part1(data), _part2(data))
+        """,
+        """
+        def solve(data):
+            parsed = _parse(data)
+            return (_part1(parsed), _part2(parsed))
+        """,
+        '''
+        def solve(data):
+            """Solve both parts."""
+            parsed = _parse(data)
+            return (_part1(parsed), _part2(parsed))
+        ''',
+    ],
+    ids=["input", "parsed", "docstring"],
+)
+def test_phases_are_timed_separately(tmp_path, source):
+    assert has_phases(load_source(tmp_path, source))
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        """
+        def solve(data):
+            parsed = _parse(data)
+            return (_part1(parsed), _part2(parsed) + 1)
+        """,
+        """
+        def solve(data):
+            parsed = _parse(data)
+            return (_part1(parsed), _part2(data))
+        """,
+        """
+        def solve(data):
+            parsed = _parse(data)
+            answer = _part1(parsed)
+            return (answer, _part2(parsed))
+        """,
+    ],
+    ids=["post-processing", "different argument", "extra statement"],
+)
+def test_other_solve_steps_are_timed_as_a_whole(tmp_path, source):
+    assert not has_phases(load_source(tmp_path, source))
+
+
+def test_module_without_part1_is_timed_as_a_whole(tmp_path):
+    module = load_source(
+        tmp_path,
+        """
+        def solve(data):
+            parsed = _parse(data)
+            return (_part1(parsed), _part2(parsed))
+        """,
+    )
+    del module._part1  # pylint: disable=protected-access
+
+    assert not has_phases(module)
@@ -0,0 +1,151 @@
+"""Tests of the Coordinate shared by the days of every year"""
+
+import random
+import sys
+
+import pytest
+
+from aoc.discovery import load_module
+from aoc.microbench import BENCHMARKS, replaced
+
+
+@pytest.fixture(name="coordinate", params=[2023, 2024, 2025])
+def fixture_coordinate(request):
+    """Coordinate of the utilities of a year."""
+    return load_module(request.param, "utilities").Coordinate
+
+
+def test_arithmetic(coordinate):
+    point = coordinate(1, 2)
+
+    assert point + coordinate(3, 4) == coordinate(4, 6)
+    assert point - coordinate(3, 4) == coordinate(-2, -2)
+    assert point * 3 == 3 * point == coordinate(3, 6)
+
+
+def test_tuples_are_added_not_concatenated(coordinate):
+    assert (1, 1) + coordinate(1, 2) == coordinate(2, 3)
+    assert coordinate(1, 2) + (1, 1) == coordinate(2, 3)
+
+
+def test_multiplying_by_anything_but_an_int_raises(coordinate):
+    with pytest.raises(TypeError):
+        _ = coordinate(1, 2) * 1.5
+
+
+def test_sparse_grid_neighbours_with_the_legacy_coordinate():
+    with replaced(2024, BENCHMARKS["coordinate"].legacy):
+        utilities = sys.modules["days_2024.utilities"]
+        grid = utilities.SparseGrid(["#.", "##"], lambda value: value == "#")
+
+        assert sorted(grid.neighbours(utilities.Coordinate(0, 0))) == [(0, 1), (1, 1)]
+    assert isinstance(utilities.Coordinate(0, 0), tuple)
+
+
+def random_rows(rng, rows, columns):
+    """Rows of a random grid of # and . cells."""
+    return ["".join(rng.choice("#.") for _ in range(columns)) for _ in range(rows)]
+
+
+@pytest.mark.parametrize("include_diagonals", [True, False])
+def test_bit_grid_neighbours_match_a_naive_count(include_diagonals):
+    utilities = load_module(2025, "utilities")
+    rng = random.Random(0)
+    deltas = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+    if include_diagonals:
+        deltas += [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+    for rows, columns in [(1, 1), (1, 7), (7, 1), (5, 9), (12, 70)]:
+        data = random_rows(rng, rows, columns)
+        grid = utilities.BitGrid(data)
+        for counts in [{0}, {1, 2}, {3}, set(range(4)), {8}]:
+            expected = {
+                (x, y)
+                for y in range(rows)
+                for x in range(columns)
+                if sum(
+                    0 <= y + dy < rows
+                    and 0 <= x + dx < columns
+                    and data[y + dy][x + dx] == "#"
+                    for dx, dy in deltas
+                )
+                in counts
+            }
+
+            selected = grid.with_neighbours(counts, include_diagonals)
+
+            assert set(selected) == expected
+
+
+def test_bit_grids_of_different_sizes_differ():
+    utilities = load_module(2025, "utilities")
+    grid = utilities.BitGrid(["#.", ".."])
+
+    assert grid != utilities.BitGrid(["#.", "..", ".."])
+    assert grid != utilities.BitGrid(["#..", "..."])
+    assert grid == utilities.BitGrid(["#.", ".."])
+
+
+@pytest.mark.parametrize("operator", ["__and__", "__or__", "__sub__"])
+def test_combining_bit_grids_of_different_sizes_raises(operator):
+    utilities = load_module(2025, "utilities")
+    grid = utilities.BitGrid(["#.", ".."])
+
+    with pytest.raises(ValueError):
+        getattr(grid, operator)(utilities.BitGrid(["#.", "..", "#."]))
+
+
+@pytest.mark.parametrize(
+    "rows, columns", [(1, 1), (1, 6), (6, 1), (2, 2), (3, 7), (7, 3)]
+)
+@pytest.mark.parametrize("include_diagonals", [True, False])
+def test_flat_grid_neighbours_stay_in_bounds(rows, columns, include_diagonals):
+    utilities = load_module(2024, "utilities")
+    grid = utilities.FlatGrid(["." * columns] * rows)
+    table = grid.neighbours8 if include_diagonals else grid.neighbours4
+
+    for y in range(rows):
+        for x in range(columns):
+            point = utilities.Coordinate(x, y)
+            expected = [
+                neighbour
+                for neighbour in point.neighbours()
+                if 0 <= neighbour.x < columns
+                and 0 <= neighbour.y < rows
+                and (
+                    include_diagonals or utilities.Grid.distance(point, neighbour) == 1
+                )
+            ]
+
+            assert list(grid.neighbours(point, include_diagonals)) == expected
+            assert list(table[grid.index(point)]) == [
+                grid.index(neighbour) for neighbour in expected
+            ]
+
+
+@pytest.mark.parametrize("year", [2024, 2025])
+def test_sparse_grid_index_follows_the_changes(year):
+    utilities = load_module(year, "utilities")
+    rng = random.Random(year)
+    grid = utilities.SparseGrid(random_rows(rng, 6, 6) + ["O.#O"], lambda ch: ch != ".")
+    values = "#O@"
+
+    for _ in range(500):
+        change = rng.random()
+        point = utilities.Coordinate(rng.randrange(6), rng.randrange(7))
+        if change < 0.5:
+            grid.set(point, rng.choice(values))
+        elif change < 0.8:
+            grid.remove(point)
+        elif len(grid):
+            grid.pop_front()
+
+        for value in values:
+            # pylint: disable-next=protected-access
+            expected = {c for c, v in grid._data.items() if v == value}
+            assert set(grid.find_all(value)) == expected
+            if expected:
+                assert grid.find(value) in expected
+            else:
+                with pytest.raises(IndexError):
+                    grid.find(value)